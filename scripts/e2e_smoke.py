@@ -3,8 +3,12 @@ from __future__ import annotations
 import sys
 
 from mc_pricer.bs_closed_form import BSParams, bs_delta, bs_price, bs_vega
-from mc_pricer.greeks import mc_delta_fd_crn, mc_delta_pathwise, mc_vega_fd_crn
-from mc_pricer.pricer import mc_price_european_vanilla, mc_price_european_vanilla_cv
+from mc_pricer.greeks import (
+    mc_delta_fd_crn_from_z,
+    mc_delta_pathwise_from_z,
+    mc_vega_fd_crn_from_z,
+)
+from mc_pricer.pricer import _z_for_paths, mc_price_cv_from_z, mc_price_from_z
 
 
 def _assert(cond: bool, msg: str) -> None:
@@ -25,11 +29,13 @@ def main() -> int:
         f"  n_paths={n_paths}, seed={seed}, antithetic={antithetic}\n"
     )
 
+    # One draw of normals feeds every estimator below: same seed semantics,
+    # one RNG pass instead of one per pricing/Greek call.
+    z = _z_for_paths(n_paths, seed, antithetic)
+
     # ---------- Pricing smoke (MC vs BS) ----------
     for opt in ("call", "put"):
-        mc = mc_price_european_vanilla(
-            p, option=opt, n_paths=n_paths, seed=seed, antithetic=antithetic
-        )
+        mc = mc_price_from_z(z, p, opt, seed=seed, antithetic=antithetic)
         bs = bs_price(p, opt)
 
         err = abs(mc.price - bs)
@@ -46,9 +52,7 @@ def main() -> int:
         )
 
         # ---------- Control Variate smoke ----------
-        mc_cv = mc_price_european_vanilla_cv(
-            p, option=opt, n_paths=n_paths, seed=seed, antithetic=antithetic
-        )
+        mc_cv = mc_price_cv_from_z(z, p, opt, seed=seed, antithetic=antithetic)
         print(
             f"  CV={mc_cv.price:.6f}  stderr={mc_cv.stderr:.6f}  CI95={mc_cv.ci95}  "
             f"beta={mc_cv.beta:.4f}"
@@ -63,15 +67,9 @@ def main() -> int:
     bs_d = bs_delta(p, "call")
     bs_v = bs_vega(p)
 
-    delta_pw = mc_delta_pathwise(
-        p, "call", n_paths=n_paths, seed=seed, antithetic=antithetic
-    )
-    delta_fd = mc_delta_fd_crn(
-        p, "call", n_paths=n_paths, seed=seed, antithetic=antithetic
-    )
-    vega_fd = mc_vega_fd_crn(
-        p, "call", n_paths=n_paths, seed=seed, antithetic=antithetic
-    )
+    delta_pw = mc_delta_pathwise_from_z(z, p, "call", seed=seed, antithetic=antithetic)
+    delta_fd = mc_delta_fd_crn_from_z(z, p, "call", seed=seed, antithetic=antithetic)
+    vega_fd = mc_vega_fd_crn_from_z(z, p, "call", seed=seed, antithetic=antithetic)
 
     print(
         f"  Delta (pathwise): {delta_pw.value:.6f}  CI95={delta_pw.ci95}  BS={bs_d:.6f}"
@@ -1,20 +1,33 @@
-from mc_pricer.bs_closed_form import BSParams, bs_delta, bs_price, bs_vega
+from mc_pricer.bs_closed_form import (
+    BSParams,
+    bs_delta,
+    bs_price,
+    bs_price_batch,
+    bs_vega,
+)
 from mc_pricer.greeks import mc_delta_fd_crn, mc_delta_pathwise, mc_vega_fd_crn
 from mc_pricer.pricer import (
     mc_price_asian_arithmetic,
+    mc_price_asian_arithmetic_cv,
+    mc_price_european_pair,
     mc_price_european_vanilla,
     mc_price_european_vanilla_cv,
+    mc_price_vanilla_batch,
 )
 
 __all__ = [
     "BSParams",
     "bs_price",
+    "bs_price_batch",
     "bs_delta",
     "bs_vega",
     "mc_price_european_vanilla",
+    "mc_price_european_pair",
     "mc_price_european_vanilla_cv",
+    "mc_price_vanilla_batch",
     "mc_delta_pathwise",
     "mc_delta_fd_crn",
     "mc_vega_fd_crn",
     "mc_price_asian_arithmetic",
+    "mc_price_asian_arithmetic_cv",
 ]
@@ -0,0 +1,878 @@
+"""Optional Numba-accelerated Monte Carlo kernels.
+
+Numba is an optional dependency (``pip install mc-option-pricing[fast]``).
+When it is missing, every entry point here falls back to a vectorized NumPy
+implementation with identical semantics, so callers never need to branch on
+availability themselves.
+
+The JIT kernels are written as explicit loops rather than NumPy-style
+expressions: under Numba's ParallelAccelerator the loop form fuses the
+exp/payoff/reduction into a single streaming pass, avoiding the full-length
+intermediate arrays the NumPy pipeline materializes.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import guvectorize, njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    # The pricing kernels are specialized per option type instead of taking
+    # is_call as a runtime bool: LLVM then dead-code-eliminates the inactive
+    # payoff branch and auto-vectorizes the surviving one. Python-level
+    # wrappers at the bottom of this block keep the old dispatching
+    # signatures for callers.
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vanilla_call_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float]:
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            pay = S0 * math.exp(drift + vol_sqrt_t * z[i]) - K
+            if pay < 0.0:
+                pay = 0.0
+            s += pay
+            s2 += pay * pay
+        # Discount hoisted out of the loop: scaling the pooled scalars is
+        # exact (variance scales by disc^2) and saves a multiply per path.
+        disc = math.exp(-r * T)
+        return disc * s, disc * disc * s2
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vanilla_put_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float]:
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            pay = K - S0 * math.exp(drift + vol_sqrt_t * z[i])
+            if pay < 0.0:
+                pay = 0.0
+            s += pay
+            s2 += pay * pay
+        disc = math.exp(-r * T)
+        return disc * s, disc * disc * s2
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vanilla_call_sums_anti(
+        z_half: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float]:
+        n = z_half.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            e = math.exp(vol_sqrt_t * z_half[i])
+            base = S0 * math.exp(drift)
+            pay_p = base * e - K
+            if pay_p < 0.0:
+                pay_p = 0.0
+            pay_m = base / e - K
+            if pay_m < 0.0:
+                pay_m = 0.0
+            s += pay_p + pay_m
+            s2 += pay_p * pay_p + pay_m * pay_m
+        disc = math.exp(-r * T)
+        return disc * s, disc * disc * s2
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vanilla_put_sums_anti(
+        z_half: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float]:
+        n = z_half.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            e = math.exp(vol_sqrt_t * z_half[i])
+            base = S0 * math.exp(drift)
+            pay_p = K - base * e
+            if pay_p < 0.0:
+                pay_p = 0.0
+            pay_m = K - base / e
+            if pay_m < 0.0:
+                pay_m = 0.0
+            s += pay_p + pay_m
+            s2 += pay_p * pay_p + pay_m * pay_m
+        disc = math.exp(-r * T)
+        return disc * s, disc * disc * s2
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vanilla_cv_call_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float, float, float, float]:
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        sy = 0.0
+        syy = 0.0
+        sx = 0.0
+        sxx = 0.0
+        sxy = 0.0
+        for i in prange(n):
+            st = S0 * math.exp(drift + vol_sqrt_t * z[i])
+            pay = st - K
+            if pay < 0.0:
+                pay = 0.0
+            sy += pay
+            syy += pay * pay
+            sx += st
+            sxx += st * st
+            sxy += st * pay
+        # Discount hoisted: y and x both scale by disc, the squares and the
+        # cross term by disc^2 (beta is unchanged either way).
+        disc = math.exp(-r * T)
+        d2 = disc * disc
+        return disc * sy, d2 * syy, disc * sx, d2 * sxx, d2 * sxy
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _vanilla_cv_put_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float, float, float, float]:
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        sy = 0.0
+        syy = 0.0
+        sx = 0.0
+        sxx = 0.0
+        sxy = 0.0
+        for i in prange(n):
+            st = S0 * math.exp(drift + vol_sqrt_t * z[i])
+            pay = K - st
+            if pay < 0.0:
+                pay = 0.0
+            sy += pay
+            syy += pay * pay
+            sx += st
+            sxx += st * st
+            sxy += st * pay
+        # Discount hoisted: y and x both scale by disc, the squares and the
+        # cross term by disc^2 (beta is unchanged either way).
+        disc = math.exp(-r * T)
+        d2 = disc * disc
+        return disc * sy, d2 * syy, disc * sx, d2 * sxx, d2 * sxy
+
+    def vanilla_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """Fused terminal-price + payoff + discount partial reduction.
+
+        Consumes a block of normals in one parallel streaming pass and
+        returns ``(sum, sum_sq)`` of the discounted payoff, so the caller
+        can combine blocks and finish mean/stderr. Assumes ``T > 0`` and
+        ``sigma > 0`` (degenerate cases are short-circuited by the caller).
+        """
+        kern = _vanilla_call_sums if is_call else _vanilla_put_sums
+        return kern(z, S0, K, r, q, sigma, T)
+
+    def vanilla_sums_anti(
+        z_half: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """Like vanilla_sums, but each fresh draw also contributes its
+        antithetic mirror in-register -- the negated half of the buffer is
+        never materialized (exp(-v*z) is one divide away from exp(v*z)).
+        """
+        kern = _vanilla_call_sums_anti if is_call else _vanilla_put_sums_anti
+        return kern(z_half, S0, K, r, q, sigma, T)
+
+    def vanilla_cv_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float, float, float, float]:
+        """Partial sums for the control-variate regression, in one pass.
+
+        With y the discounted payoff and x the discounted stock, returns
+        ``(sum_y, sum_yy, sum_x, sum_xx, sum_xy)`` so beta and the CV
+        stderr can be pooled across blocks without a second sweep.
+        """
+        kern = _vanilla_cv_call_sums if is_call else _vanilla_cv_put_sums
+        return kern(z, S0, K, r, q, sigma, T)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def vanilla_pair_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float, float, float]:
+        """Call and put partial sums off one shared simulation pass.
+
+        Returns ``(sum_call, sum_call_sq, sum_put, sum_put_sq)`` of the
+        discounted payoffs; the put comes from call-put arithmetic
+        (put = call - (ST - K)), not a second max.
+        """
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        sc = 0.0
+        sc2 = 0.0
+        sp = 0.0
+        sp2 = 0.0
+        for i in prange(n):
+            d = S0 * math.exp(drift + vol_sqrt_t * z[i]) - K
+            c = d if d > 0.0 else 0.0
+            pp = c - d
+            sc += c
+            sc2 += c * c
+            sp += pp
+            sp2 += pp * pp
+        disc = math.exp(-r * T)
+        d2 = disc * disc
+        return disc * sc, d2 * sc2, disc * sp, d2 * sp2
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _delta_pathwise_call(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float]:
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            st = S0 * math.exp(drift + vol_sqrt_t * z[i])
+            v = st / S0 if st > K else 0.0
+            s += v
+            s2 += v * v
+
+        mean = s / n
+        var = (s2 - n * mean * mean) / (n - 1)
+        if var < 0.0:
+            var = 0.0
+        # Discount hoisted: mean and stderr both scale linearly by disc.
+        disc = math.exp(-r * T)
+        return disc * mean, disc * math.sqrt(var / n)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _delta_pathwise_put(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float]:
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            st = S0 * math.exp(drift + vol_sqrt_t * z[i])
+            v = -st / S0 if st < K else 0.0
+            s += v
+            s2 += v * v
+
+        mean = s / n
+        var = (s2 - n * mean * mean) / (n - 1)
+        if var < 0.0:
+            var = 0.0
+        disc = math.exp(-r * T)
+        return disc * mean, disc * math.sqrt(var / n)
+
+    def delta_pathwise(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """Fused pathwise-delta estimator: per-path ``disc * 1{ITM} * ST/S0``.
+
+        Returns ``(mean, stderr)`` in one streaming pass, with the indicator
+        evaluated in-register instead of via boolean/ratio temporaries.
+        """
+        kern = _delta_pathwise_call if is_call else _delta_pathwise_put
+        return kern(z, S0, K, r, q, sigma, T)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _asian_call_sums(
+        z: np.ndarray, S0: float, K: float, drift: float, vol: float, disc: float
+    ) -> tuple[float, float]:
+        n, m = z.shape
+        inv = 1.0 / (m + 1)
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            price = S0
+            acc = S0
+            for t in range(m):
+                price *= math.exp(drift + vol * z[i, t])
+                acc += price
+            pay = acc * inv - K
+            if pay < 0.0:
+                pay = 0.0
+            s += pay
+            s2 += pay * pay
+        return disc * s, disc * disc * s2
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _asian_put_sums(
+        z: np.ndarray, S0: float, K: float, drift: float, vol: float, disc: float
+    ) -> tuple[float, float]:
+        n, m = z.shape
+        inv = 1.0 / (m + 1)
+        s = 0.0
+        s2 = 0.0
+        for i in prange(n):
+            price = S0
+            acc = S0
+            for t in range(m):
+                price *= math.exp(drift + vol * z[i, t])
+                acc += price
+            pay = K - acc * inv
+            if pay < 0.0:
+                pay = 0.0
+            s += pay
+            s2 += pay * pay
+        return disc * s, disc * disc * s2
+
+    def asian_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        drift: float,
+        vol: float,
+        disc: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """Streaming Asian partial sums: walk each row of per-step normals.
+
+        The running price and time-average stay in-register per path, so
+        pricing a block needs only the z buffer -- the (n_paths, n_steps+1)
+        path matrix is never materialized. Returns ``(sum, sum_sq)`` of the
+        discounted arithmetic-average payoff. drift/vol are per-step.
+        """
+        kern = _asian_call_sums if is_call else _asian_put_sums
+        return kern(z, S0, K, drift, vol, disc)
+
+    # Per-path payoff as a gufunc: the "(k)->()" signature maps one row of
+    # normals to one payoff, and target="parallel" distributes the rows
+    # across the ufunc machinery's thread pool in a single launch.
+    @guvectorize(
+        [
+            "void(float32[:], float32, float32, float32, float32, float32[:])",
+            "void(float64[:], float64, float64, float64, float64, float64[:])",
+        ],
+        "(k),(),(),(),()->()",
+        target="parallel",
+        fastmath=True,
+    )
+    def _asian_call_payoff_gu(z_row, S0, K, drift, vol, out):  # pragma: no cover
+        m = z_row.size
+        price = S0
+        acc = S0
+        for t in range(m):
+            price *= math.exp(drift + vol * z_row[t])
+            acc += price
+        pay = acc / (m + 1) - K
+        out[0] = pay if pay > 0.0 else 0.0
+
+    @guvectorize(
+        [
+            "void(float32[:], float32, float32, float32, float32, float32[:])",
+            "void(float64[:], float64, float64, float64, float64, float64[:])",
+        ],
+        "(k),(),(),(),()->()",
+        target="parallel",
+        fastmath=True,
+    )
+    def _asian_put_payoff_gu(z_row, S0, K, drift, vol, out):  # pragma: no cover
+        m = z_row.size
+        price = S0
+        acc = S0
+        for t in range(m):
+            price *= math.exp(drift + vol * z_row[t])
+            acc += price
+        pay = K - acc / (m + 1)
+        out[0] = pay if pay > 0.0 else 0.0
+
+    def asian_payoffs_from_z(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        drift: float,
+        vol: float,
+        is_call: bool,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Undiscounted per-path Asian payoffs straight from the normals.
+
+        One gufunc launch walks every row of z without materializing the
+        path matrix. The streaming pricer keeps using asian_sums (which
+        also fuses the reduction); this entry point is for callers that
+        need the payoff vector itself, e.g. variance-reduction
+        regressions. drift/vol are per-step.
+        """
+        kern = _asian_call_payoff_gu if is_call else _asian_put_payoff_gu
+        if z.dtype == np.float32:
+            S0, K, drift, vol = (np.float32(v) for v in (S0, K, drift, vol))
+        if out is None:
+            return kern(z, S0, K, drift, vol)
+        return kern(z, S0, K, drift, vol, out)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def asian_call_fill(paths: np.ndarray, K: float, out: np.ndarray) -> None:
+        """Fused row-mean + call payoff: out[i] = max(mean(paths[i]) - K, 0).
+
+        One pass over the path matrix with the running sum in-register,
+        instead of a full np.mean sweep plus a separate np.maximum pass.
+        """
+        n, m = paths.shape
+        inv = 1.0 / m
+        for i in prange(n):
+            s = 0.0
+            for j in range(m):
+                s += paths[i, j]
+            a = s * inv - K
+            out[i] = a if a > 0.0 else 0.0
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def asian_put_fill(paths: np.ndarray, K: float, out: np.ndarray) -> None:
+        """Fused row-mean + put payoff: out[i] = max(K - mean(paths[i]), 0)."""
+        n, m = paths.shape
+        inv = 1.0 / m
+        for i in prange(n):
+            s = 0.0
+            for j in range(m):
+                s += paths[i, j]
+            a = K - s * inv
+            out[i] = a if a > 0.0 else 0.0
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def gbm_paths_fill(
+        out: np.ndarray, z: np.ndarray, S0: float, drift: float, vol: float
+    ) -> None:
+        """Fill out (n_paths, n_steps+1) with exact log-space GBM paths.
+
+        Each row is walked once with the running log-sum and exp kept
+        in-register, writing prices directly into out -- no log_inc, no
+        cumsum matrix, no separate exp pass over the full path storage.
+        """
+        n_paths, n_steps = z.shape
+        for i in prange(n_paths):
+            out[i, 0] = S0
+            acc = 0.0
+            for t in range(n_steps):
+                acc += drift + vol * z[i, t]
+                out[i, t + 1] = S0 * math.exp(acc)
+
+    # splitmix64 constants: the Weyl-sequence increment and the two
+    # finalizer multipliers.
+    _SM64_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+    _SM64_M1 = np.uint64(0xBF58476D1CE4E5B9)
+    _SM64_M2 = np.uint64(0x94D049BB133111EB)
+    _SM64_INV_2_53 = 1.0 / 9007199254740992.0  # 2^-53
+
+    @njit(cache=True)
+    def _splitmix64(x: np.uint64) -> np.uint64:
+        z = x
+        z = (z ^ (z >> np.uint64(30))) * _SM64_M1
+        z = (z ^ (z >> np.uint64(27))) * _SM64_M2
+        return z ^ (z >> np.uint64(31))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def gbm_paths_fill_rng(
+        out: np.ndarray, S0: float, drift: float, vol: float, seed: int
+    ) -> None:
+        """gbm_paths_fill with the normals drawn inside the kernel.
+
+        Each path owns its own splitmix64 counter stream (seeded from the
+        path index, not the thread id), so the result is reproducible for a
+        given seed and independent of the thread count. Normals come from
+        Box-Muller on pairs of 53-bit uniforms; no z matrix is ever
+        materialized or even generated outside the parallel region.
+        """
+        n_paths, w = out.shape
+        n_steps = w - 1
+        for i in prange(n_paths):
+            state = _splitmix64(np.uint64(seed) + np.uint64(i) * _SM64_GAMMA)
+            out[i, 0] = S0
+            acc = 0.0
+            t = 0
+            while t < n_steps:
+                state += _SM64_GAMMA
+                u1 = (float(_splitmix64(state) >> np.uint64(11)) + 0.5) * _SM64_INV_2_53
+                state += _SM64_GAMMA
+                u2 = (float(_splitmix64(state) >> np.uint64(11)) + 0.5) * _SM64_INV_2_53
+                rad = math.sqrt(-2.0 * math.log(u1))
+                ang = 6.283185307179586 * u2
+                acc += drift + vol * (rad * math.cos(ang))
+                out[i, t + 1] = S0 * math.exp(acc)
+                t += 1
+                if t < n_steps:
+                    acc += drift + vol * (rad * math.sin(ang))
+                    out[i, t + 1] = S0 * math.exp(acc)
+                    t += 1
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def mean_stderr(x: np.ndarray) -> tuple[float, float]:
+        """Single-pass (mean, stderr) via chunked parallel Welford.
+
+        One streaming pass instead of np.mean followed by np.std, with
+        per-chunk Welford accumulators merged by Chan's parallel formula
+        (numerically stable even for near-constant inputs).
+        """
+        n = x.size
+        nch = 32 if n >= 32 else 1
+        step = (n + nch - 1) // nch
+
+        counts = np.zeros(nch, dtype=np.int64)
+        means = np.zeros(nch)
+        m2s = np.zeros(nch)
+        for c in prange(nch):
+            lo = c * step
+            hi = min(lo + step, n)
+            mean_c = 0.0
+            m2_c = 0.0
+            cnt = 0
+            for i in range(lo, hi):
+                cnt += 1
+                d = x[i] - mean_c
+                mean_c += d / cnt
+                m2_c += d * (x[i] - mean_c)
+            counts[c] = cnt
+            means[c] = mean_c
+            m2s[c] = m2_c
+
+        n_tot = 0
+        mean = 0.0
+        m2 = 0.0
+        for c in range(nch):
+            nc = counts[c]
+            if nc == 0:
+                continue
+            delta = means[c] - mean
+            tot = n_tot + nc
+            m2 += m2s[c] + delta * delta * n_tot * nc / tot
+            mean += delta * nc / tot
+            n_tot = tot
+
+        var = m2 / (n_tot - 1)
+        if var < 0.0:
+            var = 0.0
+        return mean, math.sqrt(var / n_tot)
+
+else:
+
+    def vanilla_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """NumPy fallback for the fused vanilla partial-sum kernel."""
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        disc = math.exp(-r * T)
+
+        ST = S0 * np.exp(drift + vol_sqrt_t * z)
+        pay = np.maximum(ST - K, 0.0) if is_call else np.maximum(K - ST, 0.0)
+        if pay.dtype != np.float64:  # fp32 inputs: accumulate in fp64
+            pay = pay.astype(np.float64)
+        # Discount folded into the pooled scalars instead of a full-array
+        # pass: sum scales by disc, sum-of-squares by disc^2, exactly.
+        return disc * float(pay.sum()), disc * disc * float(np.dot(pay, pay))
+
+    def vanilla_sums_anti(
+        z_half: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """NumPy fallback for the in-kernel antithetic vanilla sums."""
+        sp, sp2 = vanilla_sums(z_half, S0, K, r, q, sigma, T, is_call)
+        sm, sm2 = vanilla_sums(-z_half, S0, K, r, q, sigma, T, is_call)
+        return sp + sm, sp2 + sm2
+
+    def vanilla_cv_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float, float, float, float]:
+        """NumPy fallback for the fused control-variate partial sums."""
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        disc = math.exp(-r * T)
+
+        x = S0 * np.exp(drift + vol_sqrt_t * z)
+        y = np.maximum(x - K, 0.0) if is_call else np.maximum(K - x, 0.0)
+        if x.dtype != np.float64:  # fp32 inputs: accumulate in fp64
+            x = x.astype(np.float64)
+            y = y.astype(np.float64)
+        # Discount hoisted into the scalars: linear sums scale by disc,
+        # quadratic ones by disc^2 (beta is invariant to the common scale).
+        d2 = disc * disc
+        return (
+            disc * float(y.sum()),
+            d2 * float(np.dot(y, y)),
+            disc * float(x.sum()),
+            d2 * float(np.dot(x, x)),
+            d2 * float(np.dot(x, y)),
+        )
+
+    def vanilla_pair_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+    ) -> tuple[float, float, float, float]:
+        """NumPy fallback for the shared call/put partial sums."""
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        disc = math.exp(-r * T)
+
+        d = S0 * np.exp(drift + vol_sqrt_t * z)
+        d -= K
+        call = np.maximum(d, 0.0)
+        put = call - d  # put = call - (ST - K), no second max
+        if call.dtype != np.float64:  # fp32 inputs: accumulate in fp64
+            call = call.astype(np.float64)
+            put = put.astype(np.float64)
+        d2 = disc * disc
+        return (
+            disc * float(call.sum()),
+            d2 * float(np.dot(call, call)),
+            disc * float(put.sum()),
+            d2 * float(np.dot(put, put)),
+        )
+
+    def delta_pathwise(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        r: float,
+        q: float,
+        sigma: float,
+        T: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """NumPy fallback for the fused pathwise-delta kernel."""
+        n = z.size
+        drift = (r - q - 0.5 * sigma * sigma) * T
+        vol_sqrt_t = sigma * math.sqrt(T)
+        disc = math.exp(-r * T)
+
+        ST = S0 * np.exp(drift + vol_sqrt_t * z)
+        dST_dS0 = ST / S0
+        if is_call:
+            per_path = (ST > K) * dST_dS0
+        else:
+            per_path = (ST < K) * (-dST_dS0)
+
+        if per_path.dtype != np.float64:  # fp32 inputs: accumulate in fp64
+            per_path = per_path.astype(np.float64)
+        # Discount applied to the scalars: mean and stderr scale linearly.
+        mean = float(np.mean(per_path))
+        stdev = float(np.std(per_path, ddof=1))
+        return disc * mean, disc * stdev / math.sqrt(n)
+
+    def asian_sums(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        drift: float,
+        vol: float,
+        disc: float,
+        is_call: bool,
+    ) -> tuple[float, float]:
+        """NumPy fallback for the streaming Asian partial sums.
+
+        Builds the chunk's cumulative log-prices (chunk-sized, not
+        full-run-sized) and reduces them to the discounted payoff sums.
+        """
+        log_S = np.cumsum(drift + vol * z, axis=1)
+        np.exp(log_S, out=log_S)
+        avg = S0 * (1.0 + log_S.sum(axis=1)) / (z.shape[1] + 1)
+        pay = np.maximum(avg - K, 0.0) if is_call else np.maximum(K - avg, 0.0)
+        if pay.dtype != np.float64:  # fp32 inputs: accumulate in fp64
+            pay = pay.astype(np.float64)
+        return disc * float(pay.sum()), disc * disc * float(np.dot(pay, pay))
+
+    def asian_payoffs_from_z(
+        z: np.ndarray,
+        S0: float,
+        K: float,
+        drift: float,
+        vol: float,
+        is_call: bool,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """NumPy fallback for the per-path Asian payoff gufunc."""
+        log_S = np.cumsum(drift + vol * z, axis=1)
+        np.exp(log_S, out=log_S)
+        avg = S0 * (1.0 + log_S.sum(axis=1)) / (z.shape[1] + 1)
+        if is_call:
+            np.subtract(avg, K, out=avg)
+        else:
+            np.subtract(K, avg, out=avg)
+        return np.maximum(avg, 0.0, out=avg if out is None else out)
+
+    def asian_call_fill(paths: np.ndarray, K: float, out: np.ndarray) -> None:
+        """NumPy fallback for the fused Asian call payoff."""
+        np.mean(paths, axis=1, out=out)
+        np.subtract(out, K, out=out)
+        np.clip(out, 0.0, None, out=out)
+
+    def asian_put_fill(paths: np.ndarray, K: float, out: np.ndarray) -> None:
+        """NumPy fallback for the fused Asian put payoff."""
+        np.mean(paths, axis=1, out=out)
+        np.subtract(K, out, out=out)
+        np.clip(out, 0.0, None, out=out)
+
+    def gbm_paths_fill(
+        out: np.ndarray, z: np.ndarray, S0: float, drift: float, vol: float
+    ) -> None:
+        """NumPy fallback for the fused path filler (cumsum pipeline)."""
+        log_S = np.cumsum(drift + vol * z, axis=1)
+        np.exp(log_S, out=log_S)
+        out[:, 0] = S0
+        np.multiply(log_S, S0, out=out[:, 1:])
+
+    def _splitmix64_mix(x: np.ndarray) -> np.ndarray:
+        """splitmix64 finalizer, vectorized over uint64 state arrays."""
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+    def gbm_paths_fill_rng(
+        out: np.ndarray, S0: float, drift: float, vol: float, seed: int
+    ) -> None:
+        """NumPy fallback for the in-kernel splitmix64 path filler.
+
+        Reproduces the same per-path counter streams (splitmix64 plus
+        Box-Muller), then reuses the cumsum pipeline.
+        """
+        n_paths, w = out.shape
+        n_steps = w - 1
+        gamma = np.uint64(0x9E3779B97F4A7C15)
+        base = _splitmix64_mix(
+            np.uint64(seed) + np.arange(n_paths, dtype=np.uint64) * gamma
+        )
+        ndraws = 2 * ((n_steps + 1) // 2)
+        states = base[:, None] + gamma * np.arange(1, ndraws + 1, dtype=np.uint64)
+        u = (
+            (_splitmix64_mix(states) >> np.uint64(11)).astype(np.float64) + 0.5
+        ) / 9007199254740992.0
+        rad = np.sqrt(-2.0 * np.log(u[:, 0::2]))
+        ang = 6.283185307179586 * u[:, 1::2]
+        z = np.empty((n_paths, ndraws))
+        z[:, 0::2] = rad * np.cos(ang)
+        z[:, 1::2] = rad * np.sin(ang)
+        gbm_paths_fill(out, z[:, :n_steps], S0, drift, vol)
+
+    def mean_stderr(x: np.ndarray) -> tuple[float, float]:
+        """NumPy fallback for the single-pass mean/stderr reducer."""
+        n = x.size
+        # dtype=float64 keeps the accumulation fp64 even for fp32 inputs,
+        # matching the JIT kernel's float64 accumulators.
+        mean = float(np.mean(x, dtype=np.float64))
+        stdev = float(np.std(x, ddof=1, dtype=np.float64))
+        return mean, stdev / math.sqrt(n)
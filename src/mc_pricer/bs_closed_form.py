@@ -2,12 +2,26 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
-from scipy.stats import norm
+import numpy as np
 
 OptionType = Literal["call", "put"]
 
+_INV_SQRT_2 = 0.7071067811865476  # 1/sqrt(2)
+_INV_SQRT_2PI = 0.3989422804014327  # 1/sqrt(2*pi)
+
+
+def _Phi(x: float) -> float:
+    """Standard normal CDF via math.erfc (no scipy dispatch on the scalar path)."""
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+def _phi(x: float) -> float:
+    """Standard normal PDF."""
+    return math.exp(-0.5 * x * x) * _INV_SQRT_2PI
+
 
 @dataclass(frozen=True)
 class BSParams:
@@ -28,32 +42,42 @@ class BSParams:
     sigma: float
     T: float
 
-
-def _validate(p: BSParams) -> None:
-    if p.S0 <= 0.0:
-        raise ValueError("S0 must be > 0")
-    if p.K <= 0.0:
-        raise ValueError("K must be > 0")
-    if p.sigma < 0.0:
-        raise ValueError("sigma must be >= 0")
-    if p.T < 0.0:
-        raise ValueError("T must be >= 0")
-
-
-def _d1_d2(p: BSParams) -> tuple[float, float]:
-    """Compute d1 and d2. Assumes validated p and sigma>0, T>0."""
-    vol_sqrt_t = p.sigma * math.sqrt(p.T)
-    d1 = (
-        math.log(p.S0 / p.K) + (p.r - p.q + 0.5 * p.sigma * p.sigma) * p.T
-    ) / vol_sqrt_t
+    def __post_init__(self) -> None:
+        # Frozen dataclass: validating once here means every consumer can
+        # assume a well-formed instance instead of re-checking per call.
+        if self.S0 <= 0.0:
+            raise ValueError("S0 must be > 0")
+        if self.K <= 0.0:
+            raise ValueError("K must be > 0")
+        if self.sigma < 0.0:
+            raise ValueError("sigma must be >= 0")
+        if self.T < 0.0:
+            raise ValueError("T must be >= 0")
+
+
+@lru_cache(maxsize=128)
+def _bs_core(
+    S0: float, K: float, r: float, q: float, sigma: float, T: float
+) -> tuple[float, float, float, float, float, float, float]:
+    """Shared Black-Scholes intermediates. Assumes validated inputs, sigma>0, T>0.
+
+    Returns (d1, d2, df_r, df_q, Nd1, Nd2, nd1). Cached because price/Greek
+    functions are typically called several times on the same parameters and
+    the cdf/exp evaluations dominate their cost.
+    """
+    vol_sqrt_t = sigma * math.sqrt(T)
+    d1 = (math.log(S0 / K) + (r - q + 0.5 * sigma * sigma) * T) / vol_sqrt_t
     d2 = d1 - vol_sqrt_t
-    return d1, d2
+    df_r = math.exp(-r * T)
+    df_q = math.exp(-q * T)
+    nd1_cum = _Phi(d1)
+    nd2_cum = _Phi(d2)
+    nd1_pdf = _phi(d1)
+    return d1, d2, df_r, df_q, nd1_cum, nd2_cum, nd1_pdf
 
 
 def bs_price(p: BSParams, option: OptionType) -> float:
     """Closed-form Black-Scholes price for a European call/put."""
-    _validate(p)
-
     # Handle T=0: option is worth its intrinsic value.
     if p.T == 0.0:
         if option == "call":
@@ -68,20 +92,16 @@ def bs_price(p: BSParams, option: OptionType) -> float:
             return disc * max(fwd - p.K, 0.0)
         return disc * max(p.K - fwd, 0.0)
 
-    d1, d2 = _d1_d2(p)
-    df_r = math.exp(-p.r * p.T)
-    df_q = math.exp(-p.q * p.T)
+    _, _, df_r, df_q, nd1_cum, nd2_cum, _ = _bs_core(p.S0, p.K, p.r, p.q, p.sigma, p.T)
 
     if option == "call":
-        return p.S0 * df_q * norm.cdf(d1) - p.K * df_r * norm.cdf(d2)
+        return p.S0 * df_q * nd1_cum - p.K * df_r * nd2_cum
     else:
-        return p.K * df_r * norm.cdf(-d2) - p.S0 * df_q * norm.cdf(-d1)
+        return p.K * df_r * (1.0 - nd2_cum) - p.S0 * df_q * (1.0 - nd1_cum)
 
 
 def bs_delta(p: BSParams, option: OptionType) -> float:
     """Black-Scholes delta (dV/dS0)."""
-    _validate(p)
-
     if p.T == 0.0:
         # At expiry delta is not well-defined at-the-money; use a convention.
         if option == "call":
@@ -96,37 +116,66 @@ def bs_delta(p: BSParams, option: OptionType) -> float:
             return df_q * (1.0 if fwd > p.K else 0.0)
         return df_q * (-1.0 if fwd < p.K else 0.0)
 
-    d1, _ = _d1_d2(p)
-    df_q = math.exp(-p.q * p.T)
+    _, _, _, df_q, nd1_cum, _, _ = _bs_core(p.S0, p.K, p.r, p.q, p.sigma, p.T)
 
     if option == "call":
-        return df_q * norm.cdf(d1)
+        return df_q * nd1_cum
     else:
-        return df_q * (norm.cdf(d1) - 1.0)
+        return df_q * (nd1_cum - 1.0)
 
 
 def bs_gamma(p: BSParams) -> float:
     """Black-Scholes gamma (d^2V/dS0^2). Same for call and put."""
-    _validate(p)
-
     if p.T == 0.0 or p.sigma == 0.0:
         return 0.0
 
-    d1, _ = _d1_d2(p)
-    df_q = math.exp(-p.q * p.T)
-    return df_q * norm.pdf(d1) / (p.S0 * p.sigma * math.sqrt(p.T))
+    _, _, _, df_q, _, _, nd1_pdf = _bs_core(p.S0, p.K, p.r, p.q, p.sigma, p.T)
+    return df_q * nd1_pdf / (p.S0 * p.sigma * math.sqrt(p.T))
 
 
 def bs_vega(p: BSParams) -> float:
     """Black-Scholes vega (dV/dsigma)."""
-    _validate(p)
-
     if p.T == 0.0 or p.sigma == 0.0:
         return 0.0
 
-    d1, _ = _d1_d2(p)
-    df_q = math.exp(-p.q * p.T)
-    return p.S0 * df_q * norm.pdf(d1) * math.sqrt(p.T)
+    _, _, _, df_q, _, _, nd1_pdf = _bs_core(p.S0, p.K, p.r, p.q, p.sigma, p.T)
+    return p.S0 * df_q * nd1_pdf * math.sqrt(p.T)
+
+
+def bs_price_batch(
+    S0: np.ndarray | float,
+    K: np.ndarray | float,
+    r: np.ndarray | float,
+    q: np.ndarray | float,
+    sigma: np.ndarray | float,
+    T: np.ndarray | float,
+    is_call: np.ndarray | bool,
+) -> np.ndarray:
+    """Vectorized Black-Scholes prices for broadcastable parameter arrays.
+
+    One NumPy-level evaluation (scipy.special.ndtr for the normal CDF)
+    instead of a Python call per point -- intended for strike/maturity grids
+    in calibration or vol-surface work. Assumes sigma > 0 and T > 0
+    elementwise; use bs_price for the degenerate scalar cases.
+    """
+    from scipy.special import ndtr  # local import: keep the scalar path scipy-free
+
+    S0 = np.asarray(S0, dtype=float)
+    K = np.asarray(K, dtype=float)
+    r = np.asarray(r, dtype=float)
+    q = np.asarray(q, dtype=float)
+    sigma = np.asarray(sigma, dtype=float)
+    T = np.asarray(T, dtype=float)
+
+    vol_sqrt_t = sigma * np.sqrt(T)
+    d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    df_r = np.exp(-r * T)
+    df_q = np.exp(-q * T)
+
+    call = S0 * df_q * ndtr(d1) - K * df_r * ndtr(d2)
+    put = K * df_r * ndtr(-d2) - S0 * df_q * ndtr(-d1)
+    return np.where(is_call, call, put)
 
 
 def put_call_parity(p: BSParams) -> float:
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from mc_pricer.bs_closed_form import BSParams, bs_delta, bs_price, bs_vega
-from mc_pricer.greeks import mc_delta_fd_crn, mc_delta_pathwise, mc_vega_fd_crn
-from mc_pricer.pricer import mc_price_european_vanilla, mc_price_european_vanilla_cv
+from mc_pricer.greeks import (
+    mc_delta_fd_crn_from_z,
+    mc_delta_pathwise_from_z,
+    mc_vega_fd_crn_from_z,
+)
+from mc_pricer.pricer import _z_for_paths, mc_price_cv_from_z, mc_price_from_z
 
 
 def main() -> None:
@@ -17,13 +21,13 @@ def main() -> None:
         f"  n_paths={n_paths}, seed={seed}, antithetic={antithetic}\n"
     )
 
+    # One draw of normals feeds every estimator below: same seed semantics,
+    # one RNG pass instead of one per pricing/Greek call.
+    z = _z_for_paths(n_paths, seed, antithetic)
+
     for opt in ("call", "put"):
-        mc = mc_price_european_vanilla(
-            p, option=opt, n_paths=n_paths, seed=seed, antithetic=antithetic
-        )
-        mc_cv = mc_price_european_vanilla_cv(
-            p, option=opt, n_paths=n_paths, seed=seed, antithetic=antithetic
-        )
+        mc = mc_price_from_z(z, p, opt, seed=seed, antithetic=antithetic)
+        mc_cv = mc_price_cv_from_z(z, p, opt, seed=seed, antithetic=antithetic)
         bs = bs_price(p, opt)
 
         lo, hi = mc.ci95
@@ -39,15 +43,9 @@ def main() -> None:
             f"CI95=[{lo2:9.6f}, {hi2:9.6f}]  beta={beta:.4f}"
         )
 
-    delta_pw = mc_delta_pathwise(
-        p, "call", n_paths=n_paths, seed=seed, antithetic=antithetic
-    )
-    delta_fd = mc_delta_fd_crn(
-        p, "call", n_paths=n_paths, seed=seed, antithetic=antithetic
-    )
-    vega_fd = mc_vega_fd_crn(
-        p, "call", n_paths=n_paths, seed=seed, antithetic=antithetic
-    )
+    delta_pw = mc_delta_pathwise_from_z(z, p, "call", seed=seed, antithetic=antithetic)
+    delta_fd = mc_delta_fd_crn_from_z(z, p, "call", seed=seed, antithetic=antithetic)
+    vega_fd = mc_vega_fd_crn_from_z(z, p, "call", seed=seed, antithetic=antithetic)
 
     print("\nGreeks (CALL):")
     print(
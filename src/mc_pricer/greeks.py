@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import math
+import threading
 from dataclasses import dataclass
 from typing import Literal
 
 import numpy as np
 
-from mc_pricer.bs_closed_form import BSParams
+from mc_pricer import _kernels
+from mc_pricer.bs_closed_form import BSParams, bs_delta, bs_vega
+from mc_pricer.pricer import _mean_stderr_from_sums, _parallel_sums, _z_for_ci
 from mc_pricer.products import payoff_call, payoff_put
 
+try:  # optional: threaded, fused vector exp for the NumPy-level simulators
+    import numexpr as _ne
+except ImportError:  # pragma: no cover - exercised only without numexpr
+    _ne = None
+
 OptionType = Literal["call", "put"]
 
 
@@ -22,57 +30,203 @@ class GreekResult:
     seed: int | None
     antithetic: bool
 
-    @property
-    def ci95(self) -> tuple[float, float]:
-        return (self.ci_low, self.ci_high)
+    # Derived once at construction (cheaper than a property in print loops).
+    ci95: tuple[float, float] = (0.0, 0.0)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ci95", (self.ci_low, self.ci_high))
 
-def _z_for_paths(n_paths: int, seed: int | None, antithetic: bool) -> np.ndarray:
-    rng = np.random.default_rng(seed)
-    if not antithetic:
-        return rng.standard_normal(n_paths)
 
-    m = (n_paths + 1) // 2
-    z_half = rng.standard_normal(m)
-    return np.concatenate([z_half, -z_half])[:n_paths]
+_tls = threading.local()
+
+
+def _get_scratch(n: int, dtype: np.dtype = np.float64, key: str = "buf") -> np.ndarray:
+    """Thread-local scratch buffer, grown to the largest size requested.
+
+    Repeated Greek calls with the same n_paths (e.g. the demo/smoke loops)
+    then reuse one warm allocation instead of paying the allocator and
+    page-fault cost per call.
+    """
+    buf = getattr(_tls, key, None)
+    if buf is None or buf.size < n or buf.dtype != dtype:
+        buf = np.empty(n, dtype=dtype)
+        setattr(_tls, key, buf)
+    return buf[:n]
 
 
-def _terminal_from_z(
-    *, S0: float, r: float, q: float, sigma: float, T: float, z: np.ndarray
+def _z_for_paths(
+    n_paths: int,
+    seed: int | None,
+    antithetic: bool,
+    out: np.ndarray | None = None,
+    dtype: np.dtype = np.float64,
 ) -> np.ndarray:
-    if T == 0.0:
-        return np.full_like(z, fill_value=S0, dtype=float)
-    if sigma == 0.0:
-        st_det = S0 * math.exp((r - q) * T)
-        return np.full_like(z, fill_value=st_det, dtype=float)
+    rng = np.random.default_rng(seed)
+    out = np.empty(n_paths, dtype=dtype) if out is None else out[:n_paths]
+    if not antithetic:
+        rng.standard_normal(out=out, dtype=out.dtype)
+        return out
 
-    drift = (r - q - 0.5 * sigma * sigma) * T
-    vol_sqrt_t = sigma * math.sqrt(T)
-    return S0 * np.exp(drift + vol_sqrt_t * z)
+    # Fill the front half in place, negate into the back half: one allocation
+    # and one pass instead of the concatenate-and-slice copy.
+    m = (n_paths + 1) // 2
+    rng.standard_normal(out=out[:m], dtype=out.dtype)
+    np.negative(out[: n_paths - m], out=out[m:])
+    return out
 
 
-def _payoff(option: OptionType, ST: np.ndarray, K: float) -> np.ndarray:
+@dataclass(frozen=True)
+class _GBMCoefs:
+    """Scalar GBM coefficients, computed once per pricing call and shared
+    across the helpers instead of being rederived on every invocation."""
+
+    drift: float
+    vol_sqrt_t: float
+    disc: float
+    df_q: float
+
+
+def _coefs(p: BSParams, *, sigma: float | None = None) -> _GBMCoefs:
+    """Coefficients for p, optionally with a bumped sigma (for FD vega)."""
+    sig = p.sigma if sigma is None else sigma
+    return _GBMCoefs(
+        drift=(p.r - p.q - 0.5 * sig * sig) * p.T,
+        vol_sqrt_t=sig * math.sqrt(p.T),
+        disc=math.exp(-p.r * p.T),
+        df_q=math.exp(-p.q * p.T),
+    )
+
+
+def _terminal_from_z(S0: float, coefs: _GBMCoefs, z: np.ndarray) -> np.ndarray:
+    # z's dtype (float64, or float32 for bandwidth-bound callers) is kept.
+    # Degenerate T/sigma short-circuit to closed form in the Greek entry
+    # points, so no dedicated vol_sqrt_t == 0 branch is needed here.
+    if _ne is not None:
+        # numexpr fuses the multiply-add with a threaded vector exp, avoiding
+        # the drift + vol_sqrt_t*z intermediate of the plain ufunc chain.
+        return _ne.evaluate(
+            "S0 * exp(drift + vol_sqrt_t * z)",
+            local_dict={
+                "S0": S0,
+                "drift": coefs.drift,
+                "vol_sqrt_t": coefs.vol_sqrt_t,
+                "z": z,
+            },
+        )
+    return S0 * np.exp(coefs.drift + coefs.vol_sqrt_t * z)
+
+
+def _payoff(
+    option: OptionType,
+    ST: np.ndarray,
+    K: float,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     if option == "call":
-        return payoff_call(ST, K)
-    return payoff_put(ST, K)
+        return payoff_call(ST, K, out=out)
+    return payoff_put(ST, K, out=out)
 
 
 def _mean_stderr(x: np.ndarray) -> tuple[float, float]:
-    n = x.size
-    if n <= 1:
+    if x.size <= 1:
         raise ValueError("Need at least 2 paths.")
-    mean = float(np.mean(x))
-    stdev = float(np.std(x, ddof=1))
-    return mean, stdev / math.sqrt(n)
+    return _kernels.mean_stderr(x)
 
 
-def _ci(mean: float, stderr: float, level: float = 0.95) -> tuple[float, float]:
-    if abs(level - 0.95) < 1e-12:
-        z = 1.959963984540054
-    else:
-        from scipy.stats import norm  # local import
+def _fd_combine(
+    payoff_plus: np.ndarray, payoff_minus: np.ndarray, disc: float, denom: float
+) -> np.ndarray:
+    """disc * (plus - minus) / denom for the FD Greeks, fused when possible.
+
+    NumPy evaluates the expression as three passes over memory; numexpr does
+    it in one threaded pass, which matters on these payoff-sized arrays.
+    """
+    if _ne is not None:
+        return _ne.evaluate(
+            "disc * (pp - pm) / denom",
+            local_dict={
+                "disc": disc,
+                "pp": payoff_plus,
+                "pm": payoff_minus,
+                "denom": denom,
+            },
+        )
+    return disc * (payoff_plus - payoff_minus) / denom
+
+
+def _delta_fd_per_path(
+    p: BSParams, option: OptionType, z: np.ndarray, eps: float
+) -> np.ndarray:
+    """Per-path CRN central-difference delta estimates for the given normals.
+
+    Under GBM with CRN, ST scales linearly in S0: ST(S0 +/- eps) is just
+    ST(S0) * (1 +/- eps/S0). One terminal draw (one exp pass) covers both
+    bumps instead of two full _terminal_from_z evaluations.
+    """
+    coefs = _coefs(p)
+    rel = eps / p.S0
+    n = z.size
+    ST = _terminal_from_z(p.S0, coefs, z)
+    # Reused thread-local buffers: no fresh payoff allocations after warmup
+    # (worker threads each get their own scratch).
+    payoff_plus = _payoff(
+        option, ST * (1.0 + rel), p.K, out=_get_scratch(n, key="payoff_plus")
+    )
+    payoff_minus = _payoff(
+        option, ST * (1.0 - rel), p.K, out=_get_scratch(n, key="payoff_minus")
+    )
+    return _fd_combine(payoff_plus, payoff_minus, coefs.disc, 2.0 * eps)
+
+
+def _vega_fd_per_path(
+    p: BSParams, option: OptionType, z: np.ndarray, eps_abs: float
+) -> np.ndarray:
+    """Per-path CRN central-difference vega estimates for the given normals.
+
+    CRN rescaling: log ST is linear in sigma's contribution, so the plus leg
+    follows from the minus leg by multiplying with
+    exp((sig+ - sig-) * (sqrt(T)*z - 0.5*(sig+ + sig-)*T)) -- exact, and it
+    replaces a second full terminal simulation with one bump factor.
+    """
+    sig_plus = p.sigma + eps_abs
+    sig_minus = max(p.sigma - eps_abs, 0.0)
+    dsig = sig_plus - sig_minus
+
+    coefs_minus = _coefs(p, sigma=sig_minus)
+    n = z.size
+    ST_minus = _terminal_from_z(p.S0, coefs_minus, z)
+    bump = np.exp(dsig * (math.sqrt(p.T) * z - 0.5 * (sig_plus + sig_minus) * p.T))
+    ST_plus = ST_minus * bump
+
+    # Reused thread-local buffers: no fresh payoff allocations after warmup
+    # (worker threads each get their own scratch).
+    payoff_plus = _payoff(option, ST_plus, p.K, out=_get_scratch(n, key="payoff_plus"))
+    payoff_minus = _payoff(
+        option, ST_minus, p.K, out=_get_scratch(n, key="payoff_minus")
+    )
+    return _fd_combine(payoff_plus, payoff_minus, coefs_minus.disc, dsig)
+
 
-        z = float(norm.ppf(0.5 + level / 2.0))
+def _run_per_path(per_path, n_paths: int, seed, workers: int) -> tuple[float, float]:
+    """Finish (mean, stderr) of a per-path estimator, threaded on request.
+
+    per_path(n_chunk, chunk_seed) returns the per-path values for a slice;
+    with workers > 1 the slices run under _parallel_sums with spawned child
+    seeds, otherwise one sequential slice covers everything.
+    """
+    if workers > 1:
+
+        def _sums(n_chunk, chunk_seed):
+            v = per_path(n_chunk, chunk_seed)
+            return float(v.sum()), float(np.dot(v, v))
+
+        s, s2 = _parallel_sums(n_paths, seed, workers, _sums)
+        return _mean_stderr_from_sums(s, s2, n_paths)
+    return _mean_stderr(per_path(n_paths, seed))
+
+
+def _ci(mean: float, stderr: float, level: float = 0.95) -> tuple[float, float]:
+    z = _z_for_ci(level)
     return mean - z * stderr, mean + z * stderr
 
 
@@ -84,44 +238,75 @@ def mc_delta_pathwise(
     seed: int | None = None,
     antithetic: bool = False,
     ci_level: float = 0.95,
+    workers: int = 1,
 ) -> GreekResult:
-    """Pathwise delta estimator for European call/put under GBM."""
-    if p.S0 <= 0.0:
-        raise ValueError("S0 must be > 0")
-    if p.K <= 0.0:
-        raise ValueError("K must be > 0")
-    if p.sigma < 0.0:
-        raise ValueError("sigma must be >= 0")
-    if p.T < 0.0:
-        raise ValueError("T must be >= 0")
+    """Pathwise delta estimator for European call/put under GBM.
+
+    workers > 1 splits the paths across a thread pool with independent RNG
+    streams (see mc_price_european_vanilla).
+    """
+    # p is validated at construction (BSParams.__post_init__).
     if n_paths <= 0:
         raise ValueError("n_paths must be > 0")
 
-    z = _z_for_paths(n_paths, seed, antithetic)
-    ST = _terminal_from_z(S0=p.S0, r=p.r, q=p.q, sigma=p.sigma, T=p.T, z=z)
-
-    disc = math.exp(-p.r * p.T)
-
     if p.T == 0.0 or p.sigma == 0.0:
-        # Deterministic / expiry conventions: use step-like behavior
-        if option == "call":
-            delta = 1.0 if ST[0] > p.K else 0.0
-        else:
-            delta = -1.0 if ST[0] < p.K else 0.0
+        # Deterministic terminal: MC adds nothing, use the closed form.
+        delta = bs_delta(p, option)
         return GreekResult(delta, 0.0, delta, delta, n_paths, seed, antithetic)
 
-    dST_dS0 = ST / p.S0
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths.")
 
-    if option == "call":
-        per_path = disc * (ST > p.K) * dST_dS0
-    else:
-        per_path = disc * (-(ST < p.K) * dST_dS0)
+    is_call = option == "call"
+    if workers > 1:
 
-    mean, stderr = _mean_stderr(per_path.astype(float))
+        def _sums(n_chunk, chunk_seed):
+            z = _z_for_paths(n_chunk, chunk_seed, antithetic, out=_get_scratch(n_chunk))
+            m, se = _kernels.delta_pathwise(
+                z, p.S0, p.K, p.r, p.q, p.sigma, p.T, is_call
+            )
+            # Back out (sum, sum_sq) so the partials pool exactly.
+            s2 = se * se * n_chunk * (n_chunk - 1) + n_chunk * m * m
+            return m * n_chunk, s2
+
+        s, s2 = _parallel_sums(n_paths, seed, workers, _sums)
+        mean, stderr = _mean_stderr_from_sums(s, s2, n_paths)
+    else:
+        z = _z_for_paths(n_paths, seed, antithetic, out=_get_scratch(n_paths))
+        mean, stderr = _kernels.delta_pathwise(
+            z, p.S0, p.K, p.r, p.q, p.sigma, p.T, is_call
+        )
     lo, hi = _ci(mean, stderr, ci_level)
     return GreekResult(mean, stderr, lo, hi, n_paths, seed, antithetic)
 
 
+def mc_delta_pathwise_from_z(
+    z: np.ndarray,
+    p: BSParams,
+    option: OptionType,
+    *,
+    ci_level: float = 0.95,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> GreekResult:
+    """Pathwise delta from a caller-supplied vector of standard normals.
+
+    Same contract as mc_price_from_z: several estimators can share one z
+    draw, and seed/antithetic are recorded for provenance only.
+    """
+    if p.T == 0.0 or p.sigma == 0.0:
+        delta = bs_delta(p, option)
+        return GreekResult(delta, 0.0, delta, delta, z.size, seed, antithetic)
+    if z.size <= 1:
+        raise ValueError("Need at least 2 paths.")
+
+    mean, stderr = _kernels.delta_pathwise(
+        z, p.S0, p.K, p.r, p.q, p.sigma, p.T, option == "call"
+    )
+    lo, hi = _ci(mean, stderr, ci_level)
+    return GreekResult(mean, stderr, lo, hi, z.size, seed, antithetic)
+
+
 def mc_delta_fd_crn(
     p: BSParams,
     option: OptionType,
@@ -131,30 +316,63 @@ def mc_delta_fd_crn(
     antithetic: bool = False,
     eps_rel: float = 1e-4,
     ci_level: float = 0.95,
+    workers: int = 1,
 ) -> GreekResult:
-    """Finite-difference delta using Common Random Numbers (CRN)."""
+    """Finite-difference delta using Common Random Numbers (CRN).
+
+    workers > 1 splits the paths across a thread pool with independent RNG
+    streams (see mc_price_european_vanilla).
+    """
     if eps_rel <= 0.0:
         raise ValueError("eps_rel must be > 0")
     eps = p.S0 * eps_rel
     if eps <= 0.0:
         raise ValueError("eps must be > 0")
 
-    z = _z_for_paths(n_paths, seed, antithetic)
-    disc = math.exp(-p.r * p.T)
-
-    ST_plus = _terminal_from_z(S0=p.S0 + eps, r=p.r, q=p.q, sigma=p.sigma, T=p.T, z=z)
-    ST_minus = _terminal_from_z(S0=p.S0 - eps, r=p.r, q=p.q, sigma=p.sigma, T=p.T, z=z)
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Deterministic terminal: MC adds nothing, use the closed form.
+        delta = bs_delta(p, option)
+        return GreekResult(delta, 0.0, delta, delta, n_paths, seed, antithetic)
 
-    payoff_plus = _payoff(option, ST_plus, p.K)
-    payoff_minus = _payoff(option, ST_minus, p.K)
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths.")
 
-    per_path = disc * (payoff_plus - payoff_minus) / (2.0 * eps)
+    def _per_path(n_chunk, chunk_seed):
+        z = _z_for_paths(n_chunk, chunk_seed, antithetic, out=_get_scratch(n_chunk))
+        return _delta_fd_per_path(p, option, z, eps)
 
-    mean, stderr = _mean_stderr(per_path)
+    mean, stderr = _run_per_path(_per_path, n_paths, seed, workers)
     lo, hi = _ci(mean, stderr, ci_level)
     return GreekResult(mean, stderr, lo, hi, n_paths, seed, antithetic)
 
 
+def mc_delta_fd_crn_from_z(
+    z: np.ndarray,
+    p: BSParams,
+    option: OptionType,
+    *,
+    eps_rel: float = 1e-4,
+    ci_level: float = 0.95,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> GreekResult:
+    """FD+CRN delta from a caller-supplied vector of standard normals.
+
+    Same contract as mc_price_from_z: several estimators can share one z
+    draw, and seed/antithetic are recorded for provenance only.
+    """
+    if eps_rel <= 0.0:
+        raise ValueError("eps_rel must be > 0")
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        delta = bs_delta(p, option)
+        return GreekResult(delta, 0.0, delta, delta, z.size, seed, antithetic)
+
+    mean, stderr = _mean_stderr(_delta_fd_per_path(p, option, z, p.S0 * eps_rel))
+    lo, hi = _ci(mean, stderr, ci_level)
+    return GreekResult(mean, stderr, lo, hi, z.size, seed, antithetic)
+
+
 def mc_vega_fd_crn(
     p: BSParams,
     option: OptionType,
@@ -164,28 +382,55 @@ def mc_vega_fd_crn(
     antithetic: bool = False,
     eps_abs: float = 1e-4,
     ci_level: float = 0.95,
+    workers: int = 1,
 ) -> GreekResult:
-    """Finite-difference vega using CRN (bump sigma)."""
+    """Finite-difference vega using CRN (bump sigma).
+
+    workers > 1 splits the paths across a thread pool with independent RNG
+    streams (see mc_price_european_vanilla).
+    """
     if eps_abs <= 0.0:
         raise ValueError("eps_abs must be > 0")
-    if p.sigma < 0.0:
-        raise ValueError("sigma must be >= 0")
 
-    z = _z_for_paths(n_paths, seed, antithetic)
-    disc = math.exp(-p.r * p.T)
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Deterministic terminal: vega is exactly zero in the closed form.
+        vega = bs_vega(p)
+        return GreekResult(vega, 0.0, vega, vega, n_paths, seed, antithetic)
+
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths.")
+
+    def _per_path(n_chunk, chunk_seed):
+        z = _z_for_paths(n_chunk, chunk_seed, antithetic, out=_get_scratch(n_chunk))
+        return _vega_fd_per_path(p, option, z, eps_abs)
+
+    mean, stderr = _run_per_path(_per_path, n_paths, seed, workers)
+    lo, hi = _ci(mean, stderr, ci_level)
+    return GreekResult(mean, stderr, lo, hi, n_paths, seed, antithetic)
 
-    sig_plus = p.sigma + eps_abs
-    sig_minus = max(p.sigma - eps_abs, 0.0)
 
-    ST_plus = _terminal_from_z(S0=p.S0, r=p.r, q=p.q, sigma=sig_plus, T=p.T, z=z)
-    ST_minus = _terminal_from_z(S0=p.S0, r=p.r, q=p.q, sigma=sig_minus, T=p.T, z=z)
+def mc_vega_fd_crn_from_z(
+    z: np.ndarray,
+    p: BSParams,
+    option: OptionType,
+    *,
+    eps_abs: float = 1e-4,
+    ci_level: float = 0.95,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> GreekResult:
+    """FD+CRN vega from a caller-supplied vector of standard normals.
 
-    payoff_plus = _payoff(option, ST_plus, p.K)
-    payoff_minus = _payoff(option, ST_minus, p.K)
+    Same contract as mc_price_from_z: several estimators can share one z
+    draw, and seed/antithetic are recorded for provenance only.
+    """
+    if eps_abs <= 0.0:
+        raise ValueError("eps_abs must be > 0")
 
-    denom = sig_plus - sig_minus
-    per_path = disc * (payoff_plus - payoff_minus) / denom
+    if p.T == 0.0 or p.sigma == 0.0:
+        vega = bs_vega(p)
+        return GreekResult(vega, 0.0, vega, vega, z.size, seed, antithetic)
 
-    mean, stderr = _mean_stderr(per_path)
+    mean, stderr = _mean_stderr(_vega_fd_per_path(p, option, z, eps_abs))
     lo, hi = _ci(mean, stderr, ci_level)
-    return GreekResult(mean, stderr, lo, hi, n_paths, seed, antithetic)
+    return GreekResult(mean, stderr, lo, hi, z.size, seed, antithetic)
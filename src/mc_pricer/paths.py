@@ -4,6 +4,106 @@ import math
 
 import numpy as np
 
+from mc_pricer import _cuda, _kernels
+
+try:  # optional: threaded, fused vector exp for the terminal simulator
+    import numexpr as _ne
+except ImportError:  # pragma: no cover - exercised only without numexpr
+    _ne = None
+
+# Bit generators selectable via rng_backend. PCG64 is the default_rng
+# stream; SFC64 is NumPy's fastest generator (~2x the raw throughput) and
+# statistically solid for MC work, at the cost of a different stream.
+_BIT_GENERATORS = {
+    "pcg64": np.random.PCG64,
+    "sfc64": np.random.SFC64,
+}
+
+
+def _validate_mc_inputs(
+    S0: float,
+    sigma: float,
+    T: float,
+    n_paths: int,
+    n_steps: int | None = None,
+) -> None:
+    """Shared ValueError checks for the simulation entry points.
+
+    Run once at the outermost caller (the mc_price_* entry points do this);
+    the simulators themselves assume well-formed inputs, so tight
+    bump-and-reprice loops don't re-pay the checks on every call.
+    """
+    if S0 <= 0.0:
+        raise ValueError("S0 must be > 0")
+    if sigma < 0.0:
+        raise ValueError("sigma must be >= 0")
+    if T < 0.0:
+        raise ValueError("T must be >= 0")
+    if n_paths <= 0:
+        raise ValueError("n_paths must be > 0")
+    if n_steps is not None and n_steps <= 0:
+        raise ValueError("n_steps must be > 0")
+
+
+def _rng(seed: int | None, rng_backend: str) -> np.random.Generator:
+    try:
+        bit_gen = _BIT_GENERATORS[rng_backend]
+    except KeyError:
+        raise ValueError(
+            f"rng_backend must be one of {sorted(_BIT_GENERATORS)}, "
+            f"got {rng_backend!r}"
+        ) from None
+    return np.random.Generator(bit_gen(seed))
+
+
+class SimContext:
+    """Reusable simulation state for repeated same-size MC calls.
+
+    Holds one preallocated normals buffer and one Generator whose stream is
+    reset in place between calls, so bump-and-reprice loops (FD Greeks,
+    calibration sweeps) skip the per-call buffer allocation and Generator
+    construction. Pass it to simulate_gbm_terminal via ``ctx=``; the same
+    context serves base and bumped valuations under CRN since each call
+    regenerates the normals for its seed.
+    """
+
+    def __init__(
+        self,
+        n_paths: int,
+        dtype: np.dtype = np.float64,
+        rng_backend: str = "pcg64",
+    ) -> None:
+        if n_paths <= 0:
+            raise ValueError("n_paths must be > 0")
+        try:
+            self._bit_gen_cls = _BIT_GENERATORS[rng_backend]
+        except KeyError:
+            raise ValueError(
+                f"rng_backend must be one of {sorted(_BIT_GENERATORS)}, "
+                f"got {rng_backend!r}"
+            ) from None
+        self.n_paths = n_paths
+        self.z = np.empty(n_paths, dtype=dtype)
+        self.rng = np.random.Generator(self._bit_gen_cls())
+
+    def reseed(self, seed: int | None) -> None:
+        """Reset the stream to what a fresh Generator(seed) would produce."""
+        self.rng.bit_generator.state = self._bit_gen_cls(seed).state
+
+    def generate_normals(
+        self, seed: int | None, antithetic: bool = False
+    ) -> np.ndarray:
+        """Fill and return the context's buffer with N(0,1) draws for seed."""
+        self.reseed(seed)
+        z = self.z
+        if not antithetic:
+            self.rng.standard_normal(out=z, dtype=z.dtype)
+        else:
+            m = (self.n_paths + 1) // 2
+            self.rng.standard_normal(out=z[:m], dtype=z.dtype)
+            np.negative(z[: self.n_paths - m], out=z[m:])
+        return z
+
 
 def simulate_gbm_terminal(
     *,
@@ -15,45 +115,115 @@ def simulate_gbm_terminal(
     n_paths: int,
     seed: int | None = None,
     antithetic: bool = False,
+    dtype: np.dtype = np.float64,
+    rng_backend: str = "pcg64",
+    backend: str = "numpy",
+    out: np.ndarray | None = None,
+    ctx: SimContext | None = None,
 ) -> np.ndarray:
     """Simulate terminal values S_T under GBM (Black–Scholes)
     under the risk-neutral measure.
 
     S_T = S0 * exp((r - q - 0.5*sigma^2)*T + sigma*sqrt(T)*Z), Z~N(0,1)
+
+    dtype=np.float32 halves the buffer bandwidth; the generator writes the
+    normals straight into the typed buffer, and the MC standard error is
+    orders of magnitude above fp32 rounding at any realistic n_paths.
+
+    rng_backend="sfc64" swaps in a faster bit generator when the raw RNG
+    draw dominates wall time (large n_paths); "pcg64" keeps the
+    default_rng stream for seed compatibility.
+
+    backend="cupy" generates and transforms on the GPU and returns a
+    float32 CuPy array that stays on-device (downstream payoffs and
+    reductions should run there too; only scalars come back). Worthwhile
+    from roughly ``_cuda.GPU_MIN_PATHS`` paths. dtype and rng_backend
+    apply to the numpy backend only.
+
+    out= writes S_T into an existing (n_paths,) buffer; ctx= reuses a
+    SimContext's buffer and generator across calls (its dtype and bit
+    generator take precedence). Both are numpy-backend only.
+
+    Inputs are assumed well-formed: callers validate once up front (the
+    pricer entry points via _validate_mc_inputs, or BSParams itself)
+    rather than per simulation call.
     """
 
-    if S0 <= 0.0:
-        raise ValueError("S0 must be > 0")
-    if sigma < 0.0:
-        raise ValueError("sigma must be >= 0")
-    if T < 0.0:
-        raise ValueError("T must be >= 0")
-    if n_paths <= 0:
-        raise ValueError("n_paths must be > 0")
+    if backend == "cupy":
+        if not _cuda.HAVE_CUPY:
+            raise RuntimeError("backend='cupy' requires CuPy to be installed")
+        return _cuda.simulate_terminal_gpu(
+            S0=S0,
+            r=r,
+            q=q,
+            sigma=sigma,
+            T=T,
+            n_paths=n_paths,
+            seed=seed,
+            antithetic=antithetic,
+        )
+    if backend != "numpy":
+        raise ValueError(f"backend must be 'numpy' or 'cupy', got {backend!r}")
 
-    # Deterministic cases
-    if T == 0.0:
-        return np.full(shape=(n_paths,), fill_value=S0, dtype=float)
+    if ctx is not None:
+        if out is not None:
+            raise ValueError("pass either out or ctx, not both")
+        if ctx.n_paths != n_paths:
+            raise ValueError(
+                f"ctx was sized for {ctx.n_paths} paths, got n_paths={n_paths}"
+            )
+    elif out is not None and out.shape != (n_paths,):
+        raise ValueError(f"out must have shape ({n_paths},), got {out.shape}")
 
-    if sigma == 0.0:
-        # Deterministic forward under r-q
-        ST_det = S0 * math.exp((r - q) * T)
-        return np.full(shape=(n_paths,), fill_value=ST_det, dtype=float)
+    # Deterministic cases
+    if T == 0.0 or sigma == 0.0:
+        fill_value = S0 if T == 0.0 else S0 * math.exp((r - q) * T)
+        buf = ctx.z if ctx is not None else out
+        if buf is None:
+            return np.full(shape=(n_paths,), fill_value=fill_value, dtype=dtype)
+        buf.fill(fill_value)
+        return buf
 
-    rng = np.random.default_rng(seed)
     vol_sqrt_t = sigma * math.sqrt(T)
     drift = (r - q - 0.5 * sigma * sigma) * T
 
-    if not antithetic:
-        z = rng.standard_normal(n_paths)
+    if ctx is not None:
+        z = ctx.generate_normals(seed, antithetic)
     else:
-        # Generate ceil(n/2) normals, mirror them, then slice to n_paths
-        m = (n_paths + 1) // 2
-        z_half = rng.standard_normal(m)
-        z = np.concatenate([z_half, -z_half])[:n_paths]
+        rng = _rng(seed, rng_backend)
+        z = np.empty(n_paths, dtype=dtype) if out is None else out
+        if not antithetic:
+            rng.standard_normal(out=z, dtype=z.dtype)
+        else:
+            # Generate ceil(n/2) normals straight into the front half, negate
+            # into the back half: no intermediates, no concatenate copy.
+            m = (n_paths + 1) // 2
+            rng.standard_normal(out=z[:m], dtype=z.dtype)
+            np.negative(z[: n_paths - m], out=z[m:])
 
-    ST = S0 * np.exp(drift + vol_sqrt_t * z)
-    return ST
+    if _ne is not None and z.dtype == np.float64:
+        # numexpr fuses the whole transform into one threaded pass over the
+        # buffer (it would upcast fp32, so that path keeps the ufunc chain).
+        _ne.evaluate(
+            "S0 * exp(drift + vol_sqrt_t * z)",
+            local_dict={
+                "S0": S0,
+                "drift": drift,
+                "vol_sqrt_t": vol_sqrt_t,
+                "z": z,
+            },
+            out=z,
+        )
+        return z
+
+    # In-place ufunc chain: the buffer is streamed through once instead of
+    # three separate passes for the multiply-add, exp and scale. The
+    # simulation is memory-bound at large n_paths, so passes are the cost.
+    np.multiply(z, vol_sqrt_t, out=z)
+    np.add(z, drift, out=z)
+    np.exp(z, out=z)
+    np.multiply(z, S0, out=z)
+    return z
 
 
 def simulate_gbm_paths(
@@ -67,51 +237,70 @@ def simulate_gbm_paths(
     n_steps: int,
     seed: int | None = None,
     antithetic: bool = False,
+    dtype: np.dtype = np.float64,
+    rng_backend: str = "pcg64",
 ) -> np.ndarray:
     """Simulate GBM price paths on an equidistant grid.
 
     Returns array of shape (n_paths, n_steps + 1) including S0 at t=0.
     Uses exact discretization in log-space.
-    """
-    if S0 <= 0.0:
-        raise ValueError("S0 must be > 0")
-    if sigma < 0.0:
-        raise ValueError("sigma must be >= 0")
-    if T < 0.0:
-        raise ValueError("T must be >= 0")
-    if n_paths <= 0:
-        raise ValueError("n_paths must be > 0")
-    if n_steps <= 0:
-        raise ValueError("n_steps must be > 0")
 
+    dtype=np.float32 halves the path-matrix bandwidth (see
+    simulate_gbm_terminal); normals are generated into the typed buffer.
+
+    rng_backend accepts the terminal simulator's bit generators plus
+    "numba": that one draws the normals inside the parallel path kernel
+    from per-path splitmix64 streams, so generation scales with the cores
+    and the result is reproducible for a given seed regardless of thread
+    count. It is a different stream from the NumPy generators and does not
+    support antithetic pairing.
+
+    Inputs are assumed well-formed: callers validate once up front (the
+    pricer entry points via _validate_mc_inputs, or BSParams itself)
+    rather than per simulation call.
+    """
     dt = T / n_steps
 
     # Deterministic cases
     if T == 0.0:
-        out = np.full((n_paths, n_steps + 1), S0, dtype=float)
+        out = np.full((n_paths, n_steps + 1), S0, dtype=dtype)
         return out
 
     if sigma == 0.0:
         t_grid = np.linspace(0.0, T, n_steps + 1)
         path = S0 * np.exp((r - q) * t_grid)
-        return np.tile(path[None, :], (n_paths, 1))
+        return np.tile(path[None, :], (n_paths, 1)).astype(dtype, copy=False)
 
-    rng = np.random.default_rng(seed)
     drift = (r - q - 0.5 * sigma * sigma) * dt
     vol = sigma * math.sqrt(dt)
 
+    if rng_backend == "numba":
+        if antithetic:
+            raise ValueError("antithetic is not supported with rng_backend='numba'")
+        # SeedSequence maps seed (or fresh entropy for None) to the kernel's
+        # 64-bit stream key.
+        seed64 = int(np.random.SeedSequence(seed).generate_state(1, np.uint64)[0])
+        out = np.empty((n_paths, n_steps + 1), dtype=dtype)
+        _kernels.gbm_paths_fill_rng(out, S0, drift, vol, seed64)
+        return out
+
+    rng = _rng(seed, rng_backend)
+
+    # Generate straight into a typed buffer: no fresh float64 allocation
+    # from the generator, and fp32 output when the caller asked for it.
+    z = np.empty((n_paths, n_steps), dtype=dtype)
     if not antithetic:
-        z = rng.standard_normal((n_paths, n_steps))
+        rng.standard_normal(out=z, dtype=z.dtype)
     else:
+        # Fill the front rows, negate into the back rows: same buffer, one
+        # extra pass, no z_half/-z_half/concatenate allocations.
         m = (n_paths + 1) // 2
-        z_half = rng.standard_normal((m, n_steps))
-        z_full = np.concatenate([z_half, -z_half], axis=0)[:n_paths]
-        z = z_full
-
-    log_inc = drift + vol * z
-    log_S = np.cumsum(log_inc, axis=1)
+        rng.standard_normal(out=z[:m], dtype=z.dtype)
+        np.negative(z[: n_paths - m], out=z[m:])
 
-    out = np.empty((n_paths, n_steps + 1), dtype=float)
-    out[:, 0] = S0
-    out[:, 1:] = S0 * np.exp(log_S)
+    # Fused row walk (Numba when available): cumulative log-sum and exp stay
+    # in-register, so the path storage is written once instead of touching
+    # log_inc/log_S/exp intermediates of the same size.
+    out = np.empty((n_paths, n_steps + 1), dtype=dtype)
+    _kernels.gbm_paths_fill(out, z, S0, drift, vol)
     return out
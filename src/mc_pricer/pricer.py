@@ -1,22 +1,31 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from typing import Literal
 
 import numpy as np
 
-from mc_pricer.bs_closed_form import BSParams
-from mc_pricer.paths import simulate_gbm_paths, simulate_gbm_terminal
+from mc_pricer import _cuda, _kernels
+from mc_pricer.bs_closed_form import BSParams, bs_price
+from mc_pricer.paths import (
+    _validate_mc_inputs,
+    simulate_gbm_paths,
+    simulate_gbm_terminal,
+)
 from mc_pricer.products import (
     payoff_asian_arithmetic_call,
     payoff_asian_arithmetic_put,
-    payoff_call,
-    payoff_put,
 )
 
 OptionType = Literal["call", "put"]
 
+# Block size for streaming MC: 16k float64 normals is ~128 KiB, small enough
+# to stay cache-resident between generation and the fused kernel pass.
+_CHUNK_PATHS = 16_384
+
 
 @dataclass(frozen=True)
 class MCResult:
@@ -30,54 +39,318 @@ class MCResult:
 
     # Optional metadata (harmless for existing code)
     control: str = "none"
-    beta: float | None = None
+    beta: float | tuple[float, ...] | None = None
+
+    # Derived once at construction (cheaper than a property in print loops).
+    ci95: tuple[float, float] = (0.0, 0.0)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "ci95", (self.ci_low, self.ci_high))
 
-    @property
-    def ci95(self) -> tuple[float, float]:
-        return (self.ci_low, self.ci_high)
+
+def _z_for_paths(n_paths: int, seed: int | None, antithetic: bool) -> np.ndarray:
+    """Fill a single buffer of normals, mirroring pairs in place if antithetic."""
+    rng = np.random.default_rng(seed)
+    out = np.empty(n_paths)
+    if not antithetic:
+        rng.standard_normal(out=out)
+        return out
+
+    # Draw ceil(n/2) normals straight into the front half, then negate into
+    # the back half -- no intermediate arrays, no concatenate copy.
+    m = (n_paths + 1) // 2
+    rng.standard_normal(out=out[:m])
+    np.negative(out[: n_paths - m], out=out[m:])
+    return out
+
+
+def _chunked_z(
+    n_paths: int,
+    seed: int | None,
+    antithetic: bool,
+    dtype: np.dtype = np.float64,
+):
+    """Yield blocks of normals from one reused _CHUNK_PATHS-sized buffer.
+
+    The full z vector is never materialized; antithetic pairs are mirrored
+    within each block so variance reduction is preserved. (With odd n_paths
+    the final mirrored draw is dropped, as in _z_for_paths.) With
+    dtype=np.float32 the buffer halves again; the kernels still accumulate
+    their sums in float64.
+    """
+    rng = np.random.default_rng(seed)
+    buf = np.empty(min(_CHUNK_PATHS, n_paths), dtype=dtype)
+
+    if not antithetic:
+        done = 0
+        while done < n_paths:
+            c = min(buf.size, n_paths - done)
+            rng.standard_normal(out=buf[:c], dtype=buf.dtype)
+            yield buf[:c]
+            done += c
+        return
+
+    half = max(buf.size // 2, 1)
+    m = (n_paths + 1) // 2  # fresh draws needed in total
+    drawn = 0
+    produced = 0
+    while drawn < m:
+        h = min(half, m - drawn)
+        rng.standard_normal(out=buf[:h], dtype=buf.dtype)
+        c = min(2 * h, n_paths - produced)
+        np.negative(buf[: c - h], out=buf[h:c])
+        yield buf[:c]
+        drawn += h
+        produced += c
+
+
+def _chunked_z2d(
+    n_paths: int,
+    n_steps: int,
+    seed: int | None,
+    antithetic: bool,
+    dtype: np.dtype = np.float64,
+):
+    """Yield (rows, n_steps) blocks of normals from one reused buffer.
+
+    Row-wise analogue of _chunked_z for path-dependent products: the block
+    height is sized so a block stays near _CHUNK_PATHS elements, and
+    antithetic rows are mirrored within each block (odd n_paths drops the
+    final mirrored row, as in _z_for_paths).
+    """
+    rng = np.random.default_rng(seed)
+    rows = max(_CHUNK_PATHS // n_steps, 1)
+    buf = np.empty((min(rows, n_paths), n_steps), dtype=dtype)
+
+    if not antithetic:
+        done = 0
+        while done < n_paths:
+            c = min(buf.shape[0], n_paths - done)
+            rng.standard_normal(out=buf[:c], dtype=buf.dtype)
+            yield buf[:c]
+            done += c
+        return
+
+    half = max(buf.shape[0] // 2, 1)
+    m = (n_paths + 1) // 2  # fresh rows needed in total
+    drawn = 0
+    produced = 0
+    while drawn < m:
+        h = min(half, m - drawn)
+        rng.standard_normal(out=buf[:h], dtype=buf.dtype)
+        c = min(2 * h, n_paths - produced)
+        np.negative(buf[: c - h], out=buf[h:c])
+        yield buf[:c]
+        drawn += h
+        produced += c
+
+
+def _mean_stderr_from_sums(s: float, s2: float, n: int) -> tuple[float, float]:
+    """Finish (mean, stderr) from pooled sum / sum-of-squares partials."""
+    mean = s / n
+    var = (s2 - n * mean * mean) / (n - 1)
+    return mean, math.sqrt(max(var, 0.0) / n)
+
+
+def _parallel_sums(
+    n_paths: int,
+    seed: int | None,
+    workers: int,
+    chunk_sums: Callable[[int, np.random.SeedSequence], tuple[float, float]],
+) -> tuple[float, float]:
+    """Pool (sum, sum_sq) partials for n_paths across a thread pool.
+
+    Paths are partitioned evenly and each worker draws from its own child of
+    ``SeedSequence(seed)``: the streams are statistically independent, and a
+    fixed (seed, workers) pair is reproducible. ``chunk_sums(n_chunk, child)``
+    returns the partials for its slice; the Numba kernels release the GIL
+    during their parallel regions and NumPy does so for large ufuncs, so the
+    workers genuinely overlap.
+    """
+    workers = min(workers, max(n_paths // 2, 1))  # >= 2 paths per worker
+    base, extra = divmod(n_paths, workers)
+    counts = [base + (1 if i < extra else 0) for i in range(workers)]
+    children = np.random.SeedSequence(seed).spawn(len(counts))
+
+    s = 0.0
+    s2 = 0.0
+    with ThreadPoolExecutor(max_workers=len(counts)) as pool:
+        for cs, cs2 in pool.map(chunk_sums, counts, children):
+            s += cs
+            s2 += cs2
+    return s, s2
+
+
+def _finish_cv_sums(
+    sy: float, syy: float, sx: float, sxx: float, sxy: float, n: int, ex: float
+) -> tuple[float, float, float]:
+    """Finish (price, stderr, beta) from pooled control-variate sums.
+
+    y is the discounted payoff, x the discounted control with known mean ex.
+    """
+    mean_y = sy / n
+    mean_x = sx / n
+    var_y = (syy - n * mean_y * mean_y) / (n - 1)
+    var_x = (sxx - n * mean_x * mean_x) / (n - 1)
+    if var_x <= 0.0:
+        return mean_y, math.sqrt(max(var_y, 0.0) / n), 0.0
+
+    cov_yx = (sxy - n * mean_x * mean_y) / (n - 1)
+    beta = cov_yx / var_x
+    price = mean_y - beta * (mean_x - ex)
+    # Var(y - beta*x) with the optimal beta: var_y - cov^2/var_x
+    var_cv = max(var_y - beta * cov_yx, 0.0)
+    return price, math.sqrt(var_cv / n), beta
 
 
 def _mc_mean_and_stderr(discounted_payoff: np.ndarray) -> tuple[float, float]:
-    """Return (mean, stderr) from discounted payoffs."""
-    n = discounted_payoff.size
-    if n <= 1:
+    """Return (mean, stderr) from discounted payoffs.
+
+    Single pass over the payoffs (chunked Welford under Numba) instead of
+    the separate np.mean and np.std sweeps -- the estimate is identical,
+    the memory traffic is halved.
+    """
+    if discounted_payoff.size <= 1:
         raise ValueError("Need at least 2 paths for a meaningful stderr.")
-    mean = float(np.mean(discounted_payoff))
-    # sample std with ddof=1
-    stdev = float(np.std(discounted_payoff, ddof=1))
-    stderr = stdev / math.sqrt(n)
-    return mean, stderr
+    return _kernels.mean_stderr(discounted_payoff)
+
+
+# AS 241 (Wichura, PPND16) rational-polynomial coefficients for the
+# inverse normal CDF: central region, tail, and far tail.
+_NDTRI_A = (
+    2.5090809287301226727e3,
+    3.3430575583588128105e4,
+    6.7265770927008700853e4,
+    4.5921953931549871457e4,
+    1.3731693765509461125e4,
+    1.9715909503065514427e3,
+    1.3314166789178437745e2,
+    3.3871328727963666080e0,
+)
+_NDTRI_B = (
+    5.2264952788528545610e3,
+    2.8729085735721942674e4,
+    3.9307895800092710610e4,
+    2.1213794301586595867e4,
+    5.3941960214247511077e3,
+    6.8718700749205790830e2,
+    4.2313330701600911252e1,
+    1.0,
+)
+_NDTRI_C = (
+    7.74545014278341407640e-4,
+    2.27238449892691845833e-2,
+    2.41780725177450611770e-1,
+    1.27045825245236838258e0,
+    3.64784832476320460504e0,
+    5.76949722146069140550e0,
+    4.63033784615654529590e0,
+    1.42343711074968357734e0,
+)
+_NDTRI_D = (
+    1.05075007164441684324e-9,
+    5.47593808499534494600e-4,
+    1.51986665636164571966e-2,
+    1.48103976427480074590e-1,
+    6.89767334985100004550e-1,
+    1.67638483018380384940e0,
+    2.05319162663775882187e0,
+    1.0,
+)
+_NDTRI_E = (
+    2.01033439929228813265e-7,
+    2.71155556874348757815e-5,
+    1.24266094738807843860e-3,
+    2.65321895265761230930e-2,
+    2.96560571828504891230e-1,
+    1.78482653991729133580e0,
+    5.46378491116411436990e0,
+    6.65790464350110377720e0,
+)
+_NDTRI_F = (
+    2.04426310338993978564e-15,
+    1.42151175831644588870e-7,
+    1.84631831751005468180e-5,
+    7.86869131145613259100e-4,
+    1.48753612908506148525e-2,
+    1.36929880922735805310e-1,
+    5.99832206555887937690e-1,
+    1.0,
+)
+
+
+def _poly(coeffs: tuple[float, ...], x: float) -> float:
+    """Horner evaluation, highest-order coefficient first."""
+    acc = 0.0
+    for c in coeffs:
+        acc = acc * x + c
+    return acc
+
+
+def _ndtri(p: float) -> float:
+    """Inverse standard normal CDF via AS 241 (PPND16, ~1e-16 accuracy).
+
+    Pure math-module arithmetic: keeps scipy (and its ~100-module import
+    chain) out of pricer.py entirely.
+    """
+    if not 0.0 < p < 1.0:
+        raise ValueError("p must be in (0,1)")
+    q = p - 0.5
+    if abs(q) <= 0.425:
+        r = 0.180625 - q * q
+        return q * _poly(_NDTRI_A, r) / _poly(_NDTRI_B, r)
+    r = math.sqrt(-math.log(p if q < 0.0 else 1.0 - p))
+    if r <= 5.0:
+        r -= 1.6
+        z = _poly(_NDTRI_C, r) / _poly(_NDTRI_D, r)
+    else:
+        r -= 5.0
+        z = _poly(_NDTRI_E, r) / _poly(_NDTRI_F, r)
+    return -z if q < 0.0 else z
+
+
+# Two-sided normal critical values for the usual CI levels; uncommon
+# levels are computed once via _ndtri and added.
+_Z_CACHE: dict[float, float] = {
+    0.90: 1.6448536269514722,
+    0.95: 1.959963984540054,
+    0.99: 2.5758293035489004,
+}
 
 
 def _z_for_ci(ci_level: float) -> float:
     """Two-sided normal critical value for CI level (e.g. 0.95 -> ~1.96)."""
-    if abs(ci_level - 0.95) < 1e-12:
-        return 1.959963984540054  # ~1.96
-    from scipy.stats import norm  # local import
+    z = _Z_CACHE.get(ci_level)
+    if z is None:
+        z = _ndtri(0.5 + ci_level / 2.0)
+        _Z_CACHE[ci_level] = z
+    return z
 
-    return float(norm.ppf(0.5 + ci_level / 2.0))
 
+def _apply_control_variate_mv(
+    y: np.ndarray, X: np.ndarray, ex: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """k-variate control variate: y_cv = y - (X - E[X]) @ beta.
 
-def _apply_control_variate(
-    y: np.ndarray, x: np.ndarray, ex: float
-) -> tuple[np.ndarray, float]:
-    """
-    Control variate estimator:
-        y_cv = y - beta * (x - E[x]),
-    with beta = Cov(y,x)/Var(x).
+    beta = Sxx^-1 Sxy with the sample covariance of the controls and their
+    covariance with y; the variance reduction ratio is 1/(1 - R^2) of the
+    regression, so each extra well-correlated control column helps. X is
+    (n, k), ex its known expectations. A singular Sxx (redundant or
+    constant controls) degrades gracefully to no adjustment.
 
     Returns:
         (y_cv, beta)
     """
-    x_centered = x - float(ex)
-    var_x = float(np.var(x_centered, ddof=1))
-    if var_x == 0.0:
-        return y, 0.0
-
-    cov_yx = float(np.cov(y, x_centered, ddof=1)[0, 1])
-    beta = cov_yx / var_x
-    y_cv = y - beta * x_centered
-    return y_cv, float(beta)
+    n = y.size
+    Xc = X - X.mean(axis=0)
+    sxx = (Xc.T @ Xc) / (n - 1)
+    sxy = (Xc.T @ (y - y.mean())) / (n - 1)
+    try:
+        beta = np.linalg.solve(sxx, sxy)
+    except np.linalg.LinAlgError:
+        return y, np.zeros(X.shape[1])
+    y_cv = y - (X - np.asarray(ex)[None, :]) @ beta
+    return y_cv, beta
 
 
 def mc_price_european_vanilla(
@@ -88,44 +361,129 @@ def mc_price_european_vanilla(
     seed: int | None = None,
     antithetic: bool = False,
     ci_level: float = 0.95,
+    dtype: np.dtype = np.float64,
+    workers: int = 1,
 ) -> MCResult:
     """Monte Carlo price for a European call/put under Black–Scholes GBM.
 
     Returns price + standard error and a normal-approx CI.
+
+    dtype=np.float32 halves the bandwidth of the simulation buffers; the MC
+    standard error dominates fp32 rounding by orders of magnitude, and all
+    sums still accumulate in float64, so the summary statistics are safe.
+
+    workers > 1 splits the paths across a thread pool with independent RNG
+    streams (SeedSequence.spawn). Results stay reproducible for a fixed
+    (seed, workers) pair but differ from the workers=1 stream.
+
+    When CuPy is installed and n_paths >= ``_cuda.GPU_MIN_PATHS``, the
+    simulation runs on the GPU instead: dtype and workers do not apply
+    there, the simulation is fp32, and a given seed drives CuPy's
+    generator, so it produces a different stream (and price) than the
+    CPU path does for the same arguments.
     """
     if ci_level <= 0.0 or ci_level >= 1.0:
         raise ValueError("ci_level must be in (0,1)")
+    _validate_mc_inputs(p.S0, p.sigma, p.T, n_paths)
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Degenerate cases are deterministic: every path lands on the same
+        # terminal value, so MC adds nothing. Return the closed form with
+        # zero standard error instead of simulating a constant.
+        price = bs_price(p, option)
+        stderr = 0.0
+    elif _cuda.HAVE_CUPY and n_paths >= _cuda.GPU_MIN_PATHS:
+        # Embarrassingly parallel and memory-bound: at this size the GPU
+        # wins even with fp32 simulation (MC noise >> fp32 rounding).
+        price, stderr = _cuda.mc_price_gpu(p, option, n_paths, seed, antithetic)
+    else:
+        if n_paths <= 1:
+            raise ValueError("Need at least 2 paths for a meaningful stderr.")
+        # Hot path: stream cache-sized blocks of normals through the fused
+        # kernel; neither z nor ST/payoff exist at full length.
+        is_call = option == "call"
+
+        def _sums(n_chunk, chunk_seed):
+            cs = 0.0
+            cs2 = 0.0
+            if antithetic and n_chunk % 2 == 0:
+                # Stream only the fresh half of each pair; the antithetic
+                # kernel emits (z, -z) in-register without a mirrored buffer.
+                for zb in _chunked_z(n_chunk // 2, chunk_seed, False, dtype=dtype):
+                    bs, bs2 = _kernels.vanilla_sums_anti(
+                        zb, p.S0, p.K, p.r, p.q, p.sigma, p.T, is_call
+                    )
+                    cs += bs
+                    cs2 += bs2
+                return cs, cs2
+            for zb in _chunked_z(n_chunk, chunk_seed, antithetic, dtype=dtype):
+                bs, bs2 = _kernels.vanilla_sums(
+                    zb, p.S0, p.K, p.r, p.q, p.sigma, p.T, is_call
+                )
+                cs += bs
+                cs2 += bs2
+            return cs, cs2
+
+        if workers > 1:
+            s, s2 = _parallel_sums(n_paths, seed, workers, _sums)
+        else:
+            s, s2 = _sums(n_paths, seed)
+        price, stderr = _mean_stderr_from_sums(s, s2, n_paths)
 
-    ST = simulate_gbm_terminal(
-        S0=p.S0,
-        r=p.r,
-        q=p.q,
-        sigma=p.sigma,
-        T=p.T,
+    z = _z_for_ci(ci_level)
+    ci_low = price - z * stderr
+    ci_high = price + z * stderr
+
+    return MCResult(
+        price=price,
+        stderr=stderr,
+        ci_low=ci_low,
+        ci_high=ci_high,
         n_paths=n_paths,
         seed=seed,
         antithetic=antithetic,
+        control="none",
+        beta=None,
     )
 
-    if option == "call":
-        payoff = payoff_call(ST, p.K)
-    else:
-        payoff = payoff_put(ST, p.K)
 
-    disc = math.exp(-p.r * p.T)
-    discounted_payoff = disc * payoff
+def mc_price_from_z(
+    z: np.ndarray,
+    p: BSParams,
+    option: OptionType,
+    *,
+    ci_level: float = 0.95,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> MCResult:
+    """Price a European call/put from a caller-supplied vector of normals.
 
-    price, stderr = _mc_mean_and_stderr(discounted_payoff)
+    Lets several estimators share one z draw (see the demo/smoke scripts,
+    which generate z once and reuse it across plain, CV and Greek runs).
+    seed/antithetic are recorded in the result for provenance only; z is
+    consumed as given.
+    """
+    if ci_level <= 0.0 or ci_level >= 1.0:
+        raise ValueError("ci_level must be in (0,1)")
+    n_paths = z.size
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths for a meaningful stderr.")
 
-    z = _z_for_ci(ci_level)
-    ci_low = price - z * stderr
-    ci_high = price + z * stderr
+    if p.T == 0.0 or p.sigma == 0.0:
+        price = bs_price(p, option)
+        stderr = 0.0
+    else:
+        s, s2 = _kernels.vanilla_sums(
+            z, p.S0, p.K, p.r, p.q, p.sigma, p.T, option == "call"
+        )
+        price, stderr = _mean_stderr_from_sums(s, s2, n_paths)
 
+    zc = _z_for_ci(ci_level)
     return MCResult(
         price=price,
         stderr=stderr,
-        ci_low=ci_low,
-        ci_high=ci_high,
+        ci_low=price - zc * stderr,
+        ci_high=price + zc * stderr,
         n_paths=n_paths,
         seed=seed,
         antithetic=antithetic,
@@ -134,26 +492,172 @@ def mc_price_european_vanilla(
     )
 
 
-def mc_price_european_vanilla_cv(
+def mc_price_cv_from_z(
+    z: np.ndarray,
     p: BSParams,
     option: OptionType,
     *,
+    ci_level: float = 0.95,
+    seed: int | None = None,
+    antithetic: bool = False,
+) -> MCResult:
+    """Control-variate price from a caller-supplied vector of normals.
+
+    Same contract as mc_price_from_z, with the discounted-stock control of
+    mc_price_european_vanilla_cv.
+    """
+    if ci_level <= 0.0 or ci_level >= 1.0:
+        raise ValueError("ci_level must be in (0,1)")
+    n_paths = z.size
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths for a meaningful stderr.")
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        price = bs_price(p, option)
+        stderr = 0.0
+        beta = 0.0
+    else:
+        sy, syy, sx, sxx, sxy = _kernels.vanilla_cv_sums(
+            z, p.S0, p.K, p.r, p.q, p.sigma, p.T, option == "call"
+        )
+        ex = p.S0 * math.exp(-p.q * p.T)
+        price, stderr, beta = _finish_cv_sums(sy, syy, sx, sxx, sxy, n_paths, ex)
+
+    zc = _z_for_ci(ci_level)
+    return MCResult(
+        price=price,
+        stderr=stderr,
+        ci_low=price - zc * stderr,
+        ci_high=price + zc * stderr,
+        n_paths=n_paths,
+        seed=seed,
+        antithetic=antithetic,
+        control="disc_stock",
+        beta=beta,
+    )
+
+
+def mc_price_european_pair(
+    p: BSParams,
+    *,
     n_paths: int,
     seed: int | None = None,
     antithetic: bool = False,
     ci_level: float = 0.95,
-) -> MCResult:
+    dtype: np.dtype = np.float64,
+) -> tuple[MCResult, MCResult]:
+    """Price the call and the put off one shared simulation.
+
+    Returns ``(call_result, put_result)`` from a single RNG stream and a
+    single terminal-price pass: the put payoff is recovered from the call
+    via put = call - (ST - K), so pricing both costs barely more than one.
+    The results match two separate mc_price_european_vanilla calls with the
+    same seed (both estimators see the identical draws).
     """
-    Monte Carlo price for a European call/put with Control Variate.
+    if ci_level <= 0.0 or ci_level >= 1.0:
+        raise ValueError("ci_level must be in (0,1)")
+    _validate_mc_inputs(p.S0, p.sigma, p.T, n_paths)
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Degenerate cases short-circuit to closed form; price each side.
+        return (
+            mc_price_european_vanilla(
+                p,
+                "call",
+                n_paths=n_paths,
+                seed=seed,
+                antithetic=antithetic,
+                ci_level=ci_level,
+            ),
+            mc_price_european_vanilla(
+                p,
+                "put",
+                n_paths=n_paths,
+                seed=seed,
+                antithetic=antithetic,
+                ci_level=ci_level,
+            ),
+        )
+
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths for a meaningful stderr.")
 
-    Control variate choice:
-        X = e^{-rT} * S_T
-        E[X] = S0 * e^{-qT}
+    sc = sc2 = sp = sp2 = 0.0
+    for zb in _chunked_z(n_paths, seed, antithetic, dtype=dtype):
+        cc, cc2, cp, cp2 = _kernels.vanilla_pair_sums(
+            zb, p.S0, p.K, p.r, p.q, p.sigma, p.T
+        )
+        sc += cc
+        sc2 += cc2
+        sp += cp
+        sp2 += cp2
 
-    This typically reduces variance materially for vanilla options under BS.
+    z = _z_for_ci(ci_level)
+    results = []
+    for s, s2 in ((sc, sc2), (sp, sp2)):
+        price, stderr = _mean_stderr_from_sums(s, s2, n_paths)
+        results.append(
+            MCResult(
+                price=price,
+                stderr=stderr,
+                ci_low=price - z * stderr,
+                ci_high=price + z * stderr,
+                n_paths=n_paths,
+                seed=seed,
+                antithetic=antithetic,
+                control="none",
+                beta=None,
+            )
+        )
+    return results[0], results[1]
+
+
+def mc_price_vanilla_batch(
+    p: BSParams,
+    option: OptionType,
+    *,
+    strikes: np.ndarray,
+    n_paths: int,
+    seed: int | None = None,
+    antithetic: bool = False,
+    ci_level: float = 0.95,
+    dtype: np.dtype = np.float64,
+) -> list[MCResult]:
+    """Price a strike grid off one shared terminal-price simulation.
+
+    Simulates S_T once (p.K is ignored) and evaluates every strike against
+    the same draws: one O(n_paths * n_strikes) broadcasted payoff pass plus
+    column reductions, instead of a fresh simulation and RNG stream per
+    strike. Sharing the draws also makes prices across the grid perfectly
+    comparable (no seed-to-seed noise between neighbouring strikes), which
+    is what calibration sweeps want. Returns one MCResult per strike, in
+    order.
     """
     if ci_level <= 0.0 or ci_level >= 1.0:
         raise ValueError("ci_level must be in (0,1)")
+    _validate_mc_inputs(p.S0, p.sigma, p.T, n_paths)
+    strikes = np.atleast_1d(np.asarray(strikes, dtype=np.float64))
+    if strikes.ndim != 1 or strikes.size == 0:
+        raise ValueError("strikes must be a non-empty 1-D array")
+    if np.any(strikes <= 0.0):
+        raise ValueError("strikes must be > 0")
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Deterministic terminal price: closed form per strike.
+        return [
+            mc_price_european_vanilla(
+                replace(p, K=float(k)),
+                option,
+                n_paths=n_paths,
+                seed=seed,
+                antithetic=antithetic,
+                ci_level=ci_level,
+            )
+            for k in strikes
+        ]
+
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths for a meaningful stderr.")
 
     ST = simulate_gbm_terminal(
         S0=p.S0,
@@ -164,22 +668,90 @@ def mc_price_european_vanilla_cv(
         n_paths=n_paths,
         seed=seed,
         antithetic=antithetic,
+        dtype=dtype,
     )
 
-    payoff = payoff_call(ST, p.K) if option == "call" else payoff_put(ST, p.K)
+    # Broadcasted payoff matrix (n_paths, n_strikes); column reductions in
+    # float64 regardless of the simulation dtype. The discount is folded
+    # into the pooled scalars (sums by disc, squares by disc^2), exactly.
+    if option == "call":
+        pay = np.maximum(ST[:, None] - strikes[None, :], 0.0)
+    else:
+        pay = np.maximum(strikes[None, :] - ST[:, None], 0.0)
+    s = pay.sum(axis=0, dtype=np.float64)
+    s2 = np.einsum("ij,ij->j", pay, pay, dtype=np.float64)
 
     disc = math.exp(-p.r * p.T)
+    zc = _z_for_ci(ci_level)
+    results = []
+    for k in range(strikes.size):
+        price, stderr = _mean_stderr_from_sums(
+            disc * float(s[k]), disc * disc * float(s2[k]), n_paths
+        )
+        results.append(
+            MCResult(
+                price=price,
+                stderr=stderr,
+                ci_low=price - zc * stderr,
+                ci_high=price + zc * stderr,
+                n_paths=n_paths,
+                seed=seed,
+                antithetic=antithetic,
+            )
+        )
+    return results
 
-    # Target variable: discounted payoff
-    y = disc * payoff
+
+def mc_price_european_vanilla_cv(
+    p: BSParams,
+    option: OptionType,
+    *,
+    n_paths: int,
+    seed: int | None = None,
+    antithetic: bool = False,
+    ci_level: float = 0.95,
+    dtype: np.dtype = np.float64,
+) -> MCResult:
+    """
+    Monte Carlo price for a European call/put with Control Variate.
+
+    Control variate choice:
+        X = e^{-rT} * S_T
+        E[X] = S0 * e^{-qT}
+
+    This typically reduces variance materially for vanilla options under BS.
+    """
+    if ci_level <= 0.0 or ci_level >= 1.0:
+        raise ValueError("ci_level must be in (0,1)")
+    _validate_mc_inputs(p.S0, p.sigma, p.T, n_paths)
 
     # Control: discounted stock (known expectation under risk-neutral measure)
-    x = disc * ST
     ex = p.S0 * math.exp(-p.q * p.T)
 
-    y_cv, beta = _apply_control_variate(y=y, x=x, ex=ex)
-
-    price, stderr = _mc_mean_and_stderr(y_cv)
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Deterministic terminal: the payoff has zero variance and the
+        # control is constant, so the closed form is exact and beta moot.
+        price = bs_price(p, option)
+        stderr = 0.0
+        beta = 0.0
+    else:
+        if n_paths <= 1:
+            raise ValueError("Need at least 2 paths for a meaningful stderr.")
+        # Streamed single pass: the regression sums for beta are pooled per
+        # block alongside the payoff sums, so no second sweep is needed.
+        is_call = option == "call"
+        sy = syy = sx = sxx = sxy = 0.0
+        for zb in _chunked_z(n_paths, seed, antithetic, dtype=dtype):
+            cy, cyy, cx, cxx, cxy = _kernels.vanilla_cv_sums(
+                zb, p.S0, p.K, p.r, p.q, p.sigma, p.T, is_call
+            )
+            sy += cy
+            syy += cyy
+            sx += cx
+            sxx += cxx
+            sxy += cxy
+
+        price, stderr, beta = _finish_cv_sums(sy, syy, sx, sxx, sxy, n_paths, ex)
 
     z = _z_for_ci(ci_level)
     ci_low = price - z * stderr
@@ -207,12 +779,121 @@ def mc_price_asian_arithmetic(
     seed: int | None = None,
     antithetic: bool = False,
     ci_level: float = 0.95,
+    dtype: np.dtype = np.float64,
 ) -> MCResult:
-    """Monte Carlo price for arithmetic-average Asian option (discrete monitoring)."""
+    """Monte Carlo price for arithmetic-average Asian option (discrete monitoring).
+
+    The non-degenerate path streams cache-sized row blocks of normals
+    through a fused walk that keeps each path's running price and average
+    in-register, so memory stays O(block) instead of the full
+    (n_paths, n_steps+1) path matrix.
+
+    dtype=np.float32 halves the normals-buffer bandwidth; the partial sums
+    are still pooled in float64, and fp32 rounding sits far below the MC
+    standard error at any realistic n_paths.
+    """
+    if ci_level <= 0.0 or ci_level >= 1.0:
+        raise ValueError("ci_level must be in (0,1)")
+    _validate_mc_inputs(p.S0, p.sigma, p.T, n_paths, n_steps)
+
+    disc = math.exp(-p.r * p.T)
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Deterministic paths: the tiny matrix route handles the conventions.
+        paths = simulate_gbm_paths(
+            S0=p.S0,
+            r=p.r,
+            q=p.q,
+            sigma=p.sigma,
+            T=p.T,
+            n_paths=n_paths,
+            n_steps=n_steps,
+            seed=seed,
+            antithetic=antithetic,
+            dtype=dtype,
+        )
+        payoff = (
+            payoff_asian_arithmetic_call(paths, p.K)
+            if option == "call"
+            else payoff_asian_arithmetic_put(paths, p.K)
+        )
+        # Discount applied to the scalars, not the array: exact, and skips
+        # a full-length temporary.
+        price, stderr = _mc_mean_and_stderr(payoff)
+        price *= disc
+        stderr *= disc
+    else:
+        if n_paths <= 1:
+            raise ValueError("Need at least 2 paths for a meaningful stderr.")
+        dt = p.T / n_steps
+        drift = (p.r - p.q - 0.5 * p.sigma * p.sigma) * dt
+        vol = p.sigma * math.sqrt(dt)
+        is_call = option == "call"
+
+        s = 0.0
+        s2 = 0.0
+        for zb in _chunked_z2d(n_paths, n_steps, seed, antithetic, dtype=dtype):
+            cs, cs2 = _kernels.asian_sums(zb, p.S0, p.K, drift, vol, disc, is_call)
+            s += cs
+            s2 += cs2
+        price, stderr = _mean_stderr_from_sums(s, s2, n_paths)
+
+    z = _z_for_ci(ci_level)
+    ci_low = price - z * stderr
+    ci_high = price + z * stderr
+
+    return MCResult(
+        price=price,
+        stderr=stderr,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        n_paths=n_paths,
+        seed=seed,
+        antithetic=antithetic,
+        control="none",
+        beta=None,
+    )
+
+
+def mc_price_asian_arithmetic_cv(
+    p: BSParams,
+    option: OptionType,
+    *,
+    n_paths: int,
+    n_steps: int = 50,
+    seed: int | None = None,
+    antithetic: bool = False,
+    ci_level: float = 0.95,
+) -> MCResult:
+    """Asian price with a two-variate control (discounted terminal stock
+    and discounted path average).
+
+    Both controls have exact expectations under GBM, and together they
+    explain far more payoff variance than either alone -- the path average
+    is what the payoff is actually a function of. Needs the full path
+    matrix for the per-path control columns, so unlike
+    mc_price_asian_arithmetic this variant is O(n_paths * n_steps) in
+    memory; use it when variance matters more than footprint.
+    """
     if ci_level <= 0.0 or ci_level >= 1.0:
         raise ValueError("ci_level must be in (0,1)")
-    if n_steps <= 0:
-        raise ValueError("n_steps must be > 0")
+    _validate_mc_inputs(p.S0, p.sigma, p.T, n_paths, n_steps)
+
+    if p.T == 0.0 or p.sigma == 0.0:
+        # Deterministic payoff: nothing left for the controls to remove.
+        res = mc_price_asian_arithmetic(
+            p,
+            option,
+            n_paths=n_paths,
+            n_steps=n_steps,
+            seed=seed,
+            antithetic=antithetic,
+            ci_level=ci_level,
+        )
+        return replace(res, control="disc_stock+disc_avg", beta=(0.0, 0.0))
+
+    if n_paths <= 1:
+        raise ValueError("Need at least 2 paths for a meaningful stderr.")
 
     paths = simulate_gbm_paths(
         S0=p.S0,
@@ -225,30 +906,35 @@ def mc_price_asian_arithmetic(
         seed=seed,
         antithetic=antithetic,
     )
-
     disc = math.exp(-p.r * p.T)
 
-    payoff = (
-        payoff_asian_arithmetic_call(paths, p.K)
-        if option == "call"
-        else payoff_asian_arithmetic_put(paths, p.K)
+    avg = paths.mean(axis=1)
+    y = np.maximum(avg - p.K, 0.0) if option == "call" else np.maximum(p.K - avg, 0.0)
+    y *= disc
+
+    X = np.column_stack([disc * paths[:, -1], disc * avg])
+    # E[disc*ST] = S0*e^{-qT}; E[disc*avg] is the grid average of the
+    # forward curve, computed exactly as a finite sum over the grid.
+    t_grid = np.linspace(0.0, p.T, n_steps + 1)
+    ex = np.array(
+        [
+            p.S0 * math.exp(-p.q * p.T),
+            disc * p.S0 * float(np.mean(np.exp((p.r - p.q) * t_grid))),
+        ]
     )
 
-    discounted_payoff = disc * payoff
-    price, stderr = _mc_mean_and_stderr(discounted_payoff)
-
-    z = _z_for_ci(ci_level)
-    ci_low = price - z * stderr
-    ci_high = price + z * stderr
+    y_cv, beta = _apply_control_variate_mv(y, X, ex)
+    price, stderr = _mc_mean_and_stderr(y_cv)
 
+    zc = _z_for_ci(ci_level)
     return MCResult(
         price=price,
         stderr=stderr,
-        ci_low=ci_low,
-        ci_high=ci_high,
+        ci_low=price - zc * stderr,
+        ci_high=price + zc * stderr,
         n_paths=n_paths,
         seed=seed,
         antithetic=antithetic,
-        control="none",
-        beta=None,
+        control="disc_stock+disc_avg",
+        beta=tuple(float(b) for b in beta),
     )
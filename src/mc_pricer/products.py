@@ -2,32 +2,60 @@ from __future__ import annotations
 
 import numpy as np
 
-
-def payoff_call(ST: np.ndarray, K: float) -> np.ndarray:
-    """Vectorized payoff for a European call: max(ST - K, 0)."""
-    if K <= 0.0:
-        raise ValueError("K must be > 0")
-    return np.maximum(ST - K, 0.0)
-
-
-def payoff_put(ST: np.ndarray, K: float) -> np.ndarray:
-    """Vectorized payoff for a European put: max(K - ST, 0)."""
-    if K <= 0.0:
-        raise ValueError("K must be > 0")
-    return np.maximum(K - ST, 0.0)
-
-
-def payoff_asian_arithmetic_call(paths: np.ndarray, K: float) -> np.ndarray:
-    """Arithmetic-average Asian call payoff: max(avg(S) - K, 0)."""
-    if K <= 0.0:
-        raise ValueError("K must be > 0")
-    avg = np.mean(paths, axis=1)
-    return np.maximum(avg - K, 0.0)
-
-
-def payoff_asian_arithmetic_put(paths: np.ndarray, K: float) -> np.ndarray:
-    """Arithmetic-average Asian put payoff: max(K - avg(S), 0)."""
-    if K <= 0.0:
-        raise ValueError("K must be > 0")
-    avg = np.mean(paths, axis=1)
-    return np.maximum(K - avg, 0.0)
+from mc_pricer import _kernels
+
+
+def payoff_call(ST: np.ndarray, K: float, out: np.ndarray | None = None) -> np.ndarray:
+    """Vectorized payoff for a European call: max(ST - K, 0).
+
+    Pass out= to write into an existing buffer (no fresh allocation).
+    K is assumed validated (BSParams checks it once at construction).
+    """
+    # Subtract into the output and clamp it there: the ST - K difference
+    # never exists as a separate temporary.
+    if out is None:
+        out = np.empty_like(ST)
+    np.subtract(ST, K, out=out)
+    return np.clip(out, 0.0, None, out=out)
+
+
+def payoff_put(ST: np.ndarray, K: float, out: np.ndarray | None = None) -> np.ndarray:
+    """Vectorized payoff for a European put: max(K - ST, 0).
+
+    Pass out= to write into an existing buffer (no fresh allocation).
+    K is assumed validated (BSParams checks it once at construction).
+    """
+    if out is None:
+        out = np.empty_like(ST)
+    np.subtract(K, ST, out=out)
+    return np.clip(out, 0.0, None, out=out)
+
+
+def payoff_asian_arithmetic_call(
+    paths: np.ndarray, K: float, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Arithmetic-average Asian call payoff: max(avg(S) - K, 0).
+
+    The row-mean and payoff are fused into one pass over the path matrix
+    (Numba when available). Pass out= to reuse an existing buffer.
+    K is assumed validated (BSParams checks it once at construction).
+    """
+    if out is None:
+        out = np.empty(paths.shape[0], dtype=paths.dtype)
+    _kernels.asian_call_fill(paths, K, out)
+    return out
+
+
+def payoff_asian_arithmetic_put(
+    paths: np.ndarray, K: float, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Arithmetic-average Asian put payoff: max(K - avg(S), 0).
+
+    The row-mean and payoff are fused into one pass over the path matrix
+    (Numba when available). Pass out= to reuse an existing buffer.
+    K is assumed validated (BSParams checks it once at construction).
+    """
+    if out is None:
+        out = np.empty(paths.shape[0], dtype=paths.dtype)
+    _kernels.asian_put_fill(paths, K, out)
+    return out
@@ -7,6 +7,7 @@ from mc_pricer.bs_closed_form import (
     bs_delta,
     bs_gamma,
     bs_price,
+    bs_price_batch,
     bs_vega,
     put_call_parity,
 )
@@ -42,6 +43,17 @@ def test_basic_greeks_sane_ranges():
     assert v >= 0.0
 
 
+def test_batch_prices_match_scalar():
+    strikes = [80.0, 90.0, 100.0, 110.0, 120.0]
+    for opt in ("call", "put"):
+        batch = bs_price_batch(
+            S0=100.0, K=strikes, r=0.02, q=0.01, sigma=0.2, T=1.0, is_call=opt == "call"
+        )
+        for k, price in zip(strikes, batch, strict=True):
+            p = BSParams(S0=100.0, K=k, r=0.02, q=0.01, sigma=0.2, T=1.0)
+            assert abs(price - bs_price(p, opt)) < 1e-12
+
+
 def test_invalid_params_raise():
     with pytest.raises(ValueError):
         bs_price(BSParams(S0=-1.0, K=100.0, r=0.0, q=0.0, sigma=0.2, T=1.0), "call")
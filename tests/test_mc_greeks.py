@@ -12,6 +12,16 @@ def test_delta_pathwise_matches_bs_within_ci():
     assert err <= 4.0 * res.stderr
 
 
+def test_delta_pathwise_put_matches_bs_within_ci():
+    p = BSParams(S0=100.0, K=100.0, r=0.02, q=0.01, sigma=0.2, T=1.0)
+
+    res = mc_delta_pathwise(p, "put", n_paths=120_000, seed=123, antithetic=True)
+    target = bs_delta(p, "put")
+
+    err = abs(res.value - target)
+    assert err <= 4.0 * res.stderr
+
+
 def test_delta_fd_crn_matches_bs_within_ci():
     p = BSParams(S0=100.0, K=110.0, r=0.01, q=0.0, sigma=0.25, T=0.5)
 
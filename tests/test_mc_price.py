@@ -1,7 +1,15 @@
 import math
 
+import numpy as np
+import pytest
+
 from mc_pricer.bs_closed_form import BSParams, bs_price
-from mc_pricer.pricer import mc_price_european_vanilla
+from mc_pricer.paths import SimContext, simulate_gbm_paths, simulate_gbm_terminal
+from mc_pricer.pricer import (
+    mc_price_european_pair,
+    mc_price_european_vanilla,
+    mc_price_vanilla_batch,
+)
 
 
 def test_mc_price_matches_bs_within_confidence():
@@ -28,10 +36,8 @@ def test_mc_price_matches_bs_within_confidence():
 def test_mc_put_call_parity_approx_holds():
     p = BSParams(S0=100.0, K=110.0, r=0.01, q=0.0, sigma=0.25, T=0.5)
 
-    call = mc_price_european_vanilla(
-        p, "call", n_paths=150_000, seed=7, antithetic=True
-    )
-    put = mc_price_european_vanilla(p, "put", n_paths=150_000, seed=7, antithetic=True)
+    # One shared simulation prices both legs (same draws for call and put).
+    call, put = mc_price_european_pair(p, n_paths=150_000, seed=7, antithetic=True)
 
     lhs = call.price - put.price
     rhs = p.S0 * math.exp(-p.q * p.T) - p.K * math.exp(-p.r * p.T)
@@ -39,3 +45,57 @@ def test_mc_put_call_parity_approx_holds():
     # allow statistical tolerance (combine standard errors conservatively)
     tol = 4.0 * (call.stderr + put.stderr)
     assert abs(lhs - rhs) <= tol
+
+
+def test_mc_price_vanilla_batch_matches_bs_across_strikes():
+    p = BSParams(S0=100.0, K=100.0, r=0.02, q=0.01, sigma=0.2, T=1.0)
+    strikes = [80.0, 90.0, 100.0, 110.0, 120.0]
+
+    results = mc_price_vanilla_batch(
+        p, "call", strikes=strikes, n_paths=120_000, seed=123, antithetic=True
+    )
+
+    assert len(results) == len(strikes)
+    for k, res in zip(strikes, results, strict=True):
+        bs = bs_price(
+            BSParams(S0=p.S0, K=k, r=p.r, q=p.q, sigma=p.sigma, T=p.T), "call"
+        )
+        assert res.stderr > 0.0
+        assert abs(res.price - bs) <= 4.0 * res.stderr
+
+
+def test_sim_context_reuse_matches_fresh_simulation():
+    kw = dict(S0=100.0, r=0.02, q=0.01, sigma=0.2, T=1.0, n_paths=5_000)
+
+    ctx = SimContext(n_paths=5_000)
+    fresh_a = simulate_gbm_terminal(seed=1, antithetic=True, **kw)
+    fresh_b = simulate_gbm_terminal(seed=2, antithetic=False, **kw)
+
+    # Same seeds through one reused context, interleaved, must reproduce
+    # the fresh-Generator streams exactly.
+    reused_a = simulate_gbm_terminal(seed=1, antithetic=True, ctx=ctx, **kw).copy()
+    reused_b = simulate_gbm_terminal(seed=2, antithetic=False, ctx=ctx, **kw)
+    assert reused_b is ctx.z
+
+    np.testing.assert_array_equal(reused_a, fresh_a)
+    np.testing.assert_array_equal(reused_b, fresh_b)
+
+
+def test_gbm_paths_numba_rng_backend_reproducible_and_consistent():
+    kw = dict(S0=100.0, r=0.02, q=0.01, sigma=0.2, T=1.0, n_paths=50_000, n_steps=12)
+
+    a = simulate_gbm_paths(seed=5, rng_backend="numba", **kw)
+    b = simulate_gbm_paths(seed=5, rng_backend="numba", **kw)
+
+    # Streams are keyed to the path index, so the result is reproducible
+    # regardless of how many threads the kernel ran on.
+    np.testing.assert_array_equal(a, b)
+
+    # Statistical sanity: terminal mean should sit near the forward.
+    st = a[:, -1]
+    fwd = kw["S0"] * math.exp((kw["r"] - kw["q"]) * kw["T"])
+    stderr = st.std(ddof=1) / math.sqrt(st.size)
+    assert abs(st.mean() - fwd) <= 4.0 * stderr
+
+    with pytest.raises(ValueError):
+        simulate_gbm_paths(seed=5, rng_backend="numba", antithetic=True, **kw)